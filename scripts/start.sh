@@ -12,12 +12,14 @@
 # Optional:
 #   LITESTREAM_VERSION           Binary version to download (default: 0.3.13)
 #   AIDAR_DB                     DB file path (default: aidar.db)
+#   AIDAR_TEMPLATE_RELOAD        1 = re-check template files per render (default: 0)
 
 set -euo pipefail
 
 LITESTREAM_VERSION="${LITESTREAM_VERSION:-0.5.9}"
 LITESTREAM_BIN="/tmp/litestream"
 export AIDAR_DB="${AIDAR_DB:-aidar.db}"
+export AIDAR_TEMPLATE_RELOAD="${AIDAR_TEMPLATE_RELOAD:-0}"
 
 # ── Download litestream binary ────────────────────────────────────────────────
 if [ ! -x "$LITESTREAM_BIN" ]; then
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 
 import click
@@ -7,7 +8,7 @@ import click
 from aidar.cli.main import aidar
 from aidar.core.fetcher import FetchError, FetchResult, count_words, fetch_url, read_file
 from aidar.core.scorer import compare_model_profile, compute_aggregate
-from aidar.output.formatters import to_json
+from aidar.output.formatters import to_json, to_jsonl
 from aidar.output.renderer import render_error, render_result
 from aidar.patterns.loader import load_model_profile, PatternLoadError
 
@@ -71,7 +72,13 @@ def analyze(
         render_error(str(e))
         raise SystemExit(1)
 
-    if fetch.word_count < min_words:
+    if fetch.word_count < config.min_words_for_scoring:
+        click.echo(
+            f"Warning: only {fetch.word_count} words extracted "
+            f"(--min-words-for-scoring={config.min_words_for_scoring}). Text was not scored.",
+            err=True,
+        )
+    elif fetch.word_count < min_words:
         click.echo(
             f"Warning: only {fetch.word_count} words extracted "
             f"(--min-words={min_words}). Results may be unreliable.",
@@ -99,5 +106,7 @@ def analyze(
     # Output
     if output_format == "json":
         click.echo(to_json(result))
+    elif output_format == "jsonl":
+        to_jsonl([result], sys.stdout)
     else:
         render_result(result, show_patterns=verbose)
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 
 import click
 
 from aidar.cli.main import aidar
 from aidar.core.comparator import rank_results
-from aidar.core.fetcher import FetchError, fetch_url, read_file
+from aidar.core.fetcher import FetchError, FetchResult, fetch_many_sync, read_file
 from aidar.core.scorer import compute_aggregate
-from aidar.output.formatters import to_json_list
+from aidar.output.formatters import to_json_list, to_jsonl
 from aidar.output.renderer import console, render_comparison_table, render_result
 
+# Upper bound on simultaneous fetches (fetch_many's default), however many targets
+_MAX_CONCURRENCY = 16
+
 
 @aidar.command()
 @click.argument("targets", nargs=-1, required=True)
@@ -26,12 +30,19 @@ from aidar.output.renderer import console, render_comparison_table, render_resul
     default=False,
     help="Show per-URL category breakdowns",
 )
+@click.option(
+    "--plain",
+    is_flag=True,
+    default=False,
+    help="Fixed-width table without Rich layout (faster for long lists, logs, CI)",
+)
 @click.pass_context
 def compare(
     ctx: click.Context,
     targets: tuple[str, ...],
     sort: str,
     verbose: bool,
+    plain: bool,
 ) -> None:
     """Analyze multiple URLs/files and rank by AI score."""
     if len(targets) < 2:
@@ -42,26 +53,28 @@ def compare(
     output_format = ctx.obj["output"]
 
     results = []
-    for target in targets:
-        try:
-            if target.startswith(("http://", "https://")):
-                fetch = fetch_url(target)
-                url, file_path = target, None
-            else:
-                fetch = read_file(Path(target))
-                url, file_path = None, target
-
-            score_vector = analyzer.run(fetch.text, fetch.word_count)
-            result = compute_aggregate(
-                score_vector, config,
-                url=url, file_path=file_path,
-                word_count=fetch.word_count,
-                published_date=fetch.published_date,
-                title=fetch.title,
+    fetched = _gather_targets(targets)
+    for target, fetch in zip(targets, fetched):
+        if isinstance(fetch, FetchError):
+            console.print(f"[yellow]Skipping {target}: {fetch}[/yellow]")
+            continue
+        is_url = target.startswith(("http://", "https://"))
+        url, file_path = (target, None) if is_url else (None, target)
+
+        score_vector = analyzer.run(fetch.text, fetch.word_count)
+        if score_vector.skipped:
+            console.print(
+                f"[yellow]Skipping {target}: only {fetch.word_count} words, too short to score[/yellow]"
             )
-            results.append(result)
-        except FetchError as e:
-            console.print(f"[yellow]Skipping {target}: {e}[/yellow]")
+            continue
+        result = compute_aggregate(
+            score_vector, config,
+            url=url, file_path=file_path,
+            word_count=fetch.word_count,
+            published_date=fetch.published_date,
+            title=fetch.title,
+        )
+        results.append(result)
 
     if not results:
         console.print("[red]No results to compare.[/red]")
@@ -74,8 +87,35 @@ def compare(
 
     if output_format == "json":
         click.echo(to_json_list(results))
+    elif output_format == "jsonl":
+        to_jsonl(results, sys.stdout)
     else:
-        render_comparison_table(results)
+        render_comparison_table(results, plain=plain)
         if verbose:
             for result in results:
                 render_result(result)
+
+
+def _gather_targets(targets: tuple[str, ...]) -> list[FetchResult | FetchError]:
+    """
+    Fetch every URL target concurrently (fetch_many); read files inline.
+    A handful of URLs extract in-process; only larger sets start a pool.
+
+    Returns one entry per target, in order — a FetchResult, or the FetchError
+    that target raised. Up to _MAX_CONCURRENCY fetches run at once, so for a
+    handful of targets wall time is the slowest fetch rather than the sum.
+    """
+    urls = list(dict.fromkeys(t for t in targets if t.startswith(("http://", "https://"))))
+    concurrency = min(len(urls), _MAX_CONCURRENCY)
+    pages = fetch_many_sync(urls, concurrency=concurrency) if urls else {}
+
+    fetched: list[FetchResult | FetchError] = []
+    for target in targets:
+        if target in pages:
+            fetched.append(pages[target])
+            continue
+        try:
+            fetched.append(read_file(Path(target)))
+        except FetchError as e:
+            fetched.append(e)
+    return fetched
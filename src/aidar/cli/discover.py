@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import re
 import sys
-from urllib.parse import urlparse
+from functools import lru_cache
+from itertools import islice
+from urllib.parse import ParseResult, urlparse
 
 import click
 
@@ -9,11 +12,18 @@ from aidar.cli.main import aidar
 from aidar.output.renderer import console
 
 
+@lru_cache(maxsize=4096)
+def _parse_cached(url: str) -> ParseResult:
+    """urlparse memoized for URLs re-parsed across runs (worker cycles, track re-runs)."""
+    return urlparse(url)
+
+
+@lru_cache(maxsize=256)
 def _normalize_domain(domain: str) -> str:
     """Accept 'example.com' or 'https://example.com', return base URL."""
     if not domain.startswith(("http://", "https://")):
         domain = "https://" + domain
-    parsed = urlparse(domain)
+    parsed = _parse_cached(domain)
     return f"{parsed.scheme}://{parsed.netloc}"
 
 
@@ -81,26 +91,21 @@ def discover(
         )
         raise SystemExit(1)
 
-    # Filter to article-like URLs
-    if filter_ext.strip():
-        exts = [e.strip() for e in filter_ext.split(",") if e.strip()]
-        filtered = [u for u in urls if any(u.endswith(e) or "/" in u.split(base_url)[-1] for e in exts)]
+    # Filter to article-like URLs, deduplicating (order-preserving) in the same pass
+    exts = [e.strip() for e in filter_ext.split(",") if e.strip()]
+    if exts:
+        suffix_re = re.compile("(?:" + "|".join(re.escape(e) for e in exts) + r")\Z")
+        # rpartition()[2] is the path after the last base_url occurrence (whole URL if absent)
+        kept = dict.fromkeys(
+            u for u in urls if suffix_re.search(u) or "/" in u.rpartition(base_url)[2]
+        )
         # If filtering is too aggressive, fall back to all
-        if len(filtered) < 3:
-            filtered = urls
-        urls = filtered
-
-    # Deduplicate, preserve order
-    seen: set[str] = set()
-    deduped = []
-    for u in urls:
-        if u not in seen:
-            seen.add(u)
-            deduped.append(u)
-    urls = deduped
-
-    if limit > 0:
-        urls = urls[:limit]
+        if len(kept) < 3:
+            kept = dict.fromkeys(urls)
+    else:
+        kept = dict.fromkeys(urls)
+
+    urls = list(islice(kept, limit)) if limit > 0 else list(kept)
 
     click.echo(f"Returning {len(urls)} URLs.", err=True)
 
@@ -116,8 +121,8 @@ def discover(
 def _sitemap_worker(base_url: str, queue) -> None:
     try:
         from trafilatura.sitemaps import sitemap_search
-        urls = list(sitemap_search(base_url) or [])
-        queue.put(urls)
+        # sitemap_search already returns a fresh list; don't copy it again
+        queue.put(sitemap_search(base_url) or [])
     except Exception:
         queue.put([])
 
@@ -129,7 +134,6 @@ def _sitemap_direct(base_url: str) -> list[str]:
     sitemap.xml directly and resolves all <loc> values against the base URL.
     Tries sitemap.xml and sitemap_index.xml.
     """
-    import re
     import httpx
 
     candidates = [
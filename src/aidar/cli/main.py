@@ -1,17 +1,23 @@
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 
 import click
 
 from aidar.core.analyzer import Analyzer
+from aidar.core.score_cache import CachedAnalyzer
 from aidar.models.config import AppConfig, WeightConfig
+from aidar.patterns.detectors.linguistic_detector import warm_wordfreq
 from aidar.patterns.loader import load_patterns, load_weight_config
 from aidar.patterns.registry import PatternRegistry
 
 # Default patterns directory: repo root's patterns/ folder
 _DEFAULT_PATTERNS_DIR = Path(__file__).parent.parent.parent.parent / "patterns"
 
+# Subcommands that run the analyzer (and therefore hit wordfreq and compiled regexes)
+_ANALYZING_COMMANDS = {"analyze", "compare", "scan", "track", "worker"}
+
 
 def _resolve_patterns_dir(override: str | None) -> Path:
     if override:
@@ -39,22 +45,62 @@ def _resolve_patterns_dir(override: str | None) -> Path:
 )
 @click.option(
     "--output",
-    type=click.Choice(["terminal", "json"]),
+    type=click.Choice(["terminal", "json", "jsonl"]),
     default="terminal",
     show_default=True,
-    help="Output format",
+    help="Output format (jsonl: one compact JSON object per line)",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    envvar="AIDAR_NO_CACHE",
+    help="Disable the on-disk analyzer result cache (~/.cache/aidar/scores.sqlite)",
+)
+@click.option(
+    "--min-words-for-scoring",
+    default=20,
+    show_default=True,
+    envvar="AIDAR_MIN_WORDS_FOR_SCORING",
+    help="Skip scoring entirely for texts shorter than this",
 )
 @click.pass_context
-def aidar(ctx: click.Context, patterns_dir: str | None, output: str) -> None:
+def aidar(
+    ctx: click.Context,
+    patterns_dir: str | None,
+    output: str,
+    no_cache: bool,
+    min_words_for_scoring: int,
+) -> None:
     """aidar — track stylistic patterns across the web to surface AI-era writing trends."""
     ctx.ensure_object(dict)
 
+    analyzing = ctx.invoked_subcommand in _ANALYZING_COMMANDS
+
+    # Load wordfreq's table in the background while YAML patterns parse
+    warm = None
+    if analyzing:
+        warm = threading.Thread(target=warm_wordfreq, daemon=True)
+        warm.start()
+
     resolved = _resolve_patterns_dir(patterns_dir)
     patterns = load_patterns(resolved)
     weights = load_weight_config(resolved)
 
-    registry = PatternRegistry(patterns)
-    analyzer = Analyzer(registry)
+    # Only commands that score text need compiled detectors, or an analyzer
+    # (and its on-disk score cache) at all
+    registry = PatternRegistry(patterns, precompile=analyzing)
+    analyzer: Analyzer | None = None
+    if analyzing:
+        if no_cache:
+            analyzer = Analyzer(registry, min_words=min_words_for_scoring)
+        else:
+            cached = CachedAnalyzer(registry, min_words=min_words_for_scoring)
+            # Flushes batched last_used touches and closes the cache file on exit
+            ctx.call_on_close(cached.close)
+            analyzer = cached
+    if warm is not None:
+        warm.join()
 
     ctx.obj["analyzer"] = analyzer
     ctx.obj["registry"] = registry
@@ -63,8 +109,9 @@ def aidar(ctx: click.Context, patterns_dir: str | None, output: str) -> None:
     ctx.obj["config"] = AppConfig(
         patterns_dir=str(resolved),
         weights=weights,
+        min_words_for_scoring=min_words_for_scoring,
     )
 
 
 # Import subcommands so click can register them
-from aidar.cli import analyze, compare, discover, patterns, scan, track, worker  # noqa: E402, F401
+from aidar.cli import analyze, compare, discover, patterns, scan, stats, track, worker  # noqa: E402, F401
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 import click
 from rich.console import Console
 from rich.table import Table
@@ -10,6 +12,13 @@ from aidar.cli.main import aidar
 console = Console()
 
 
+def _echo_tsv(header: tuple[str, ...], rows: Sequence[tuple[str, ...]]) -> None:
+    """Plain tab-separated output for pipes: one write, no Rich layout pass."""
+    lines = ["\t".join(header)]
+    lines.extend("\t".join(row) for row in rows)
+    click.echo("\n".join(lines))
+
+
 @aidar.group()
 def patterns() -> None:
     """Manage and inspect loaded patterns."""
@@ -24,17 +33,26 @@ def list_patterns(ctx: click.Context, category: str | None) -> None:
     registry = ctx.obj["registry"]
     by_cat = registry.patterns_by_category()
 
-    table = Table(show_header=True, header_style="bold dim", padding=(0, 1))
-    table.add_column("ID", style="cyan", width=28)
+    categories = [category] if category else sorted(by_cat.keys())
+    rows = [
+        (p.id, p.category, p.detection_type, f"{p.weight:.2f}", p.name)
+        for cat in categories
+        for p in by_cat.get(cat, [])
+    ]
+
+    if not console.is_terminal:
+        _echo_tsv(("id", "category", "type", "weight", "name"), rows)
+        return
+
+    table = Table(show_header=True, header_style="bold dim", padding=(0, 1), highlight=False)
+    table.add_column("ID", style="cyan", width=28, no_wrap=True)
     table.add_column("Category", width=14)
     table.add_column("Type", width=12)
     table.add_column("Weight", justify="right", width=7)
     table.add_column("Name")
-
-    categories = [category] if category else sorted(by_cat.keys())
-    for cat in categories:
-        for p in by_cat.get(cat, []):
-            table.add_row(p.id, p.category, p.detection_type, f"{p.weight:.2f}", p.name)
+    for row in rows:
+        # Text cells skip markup parsing (names may contain "[...]")
+        table.add_row(*map(Text, row))
 
     console.print(table)
     total = sum(len(v) for v in by_cat.values())
@@ -48,7 +66,7 @@ def versions_command(ctx: click.Context, db_path: str) -> None:
     """Show pattern versions stored in DB vs currently loaded — find what needs re-scanning."""
     import os
     from aidar.db.database import get_connection
-    from aidar.db.queries import get_pattern_version_summary
+    from aidar.db.queries import get_version_status
 
     registry = ctx.obj["registry"]
     loaded = {p.id: p.version for p in registry.all_patterns()}
@@ -58,32 +76,33 @@ def versions_command(ctx: click.Context, db_path: str) -> None:
         return
 
     conn = get_connection(db_path)
-    stored = {row["pattern_id"]: row for row in get_pattern_version_summary(conn)}
 
-    table = Table(show_header=True, header_style="bold dim", padding=(0, 1))
-    table.add_column("Pattern ID", style="cyan", width=28)
+    status_styles = {"new": "yellow", "STALE": "bold red", "ok": "green"}
+    any_stale = False
+    rows = []
+    for row in get_version_status(conn, loaded):
+        any_stale = any_stale or row["status"] == "STALE"
+        stored_v = "—" if row["stored_version"] is None else str(row["stored_version"])
+        rows.append((
+            row["pattern_id"],
+            str(row["loaded_version"]),
+            stored_v,
+            str(row["scan_count"]),
+            row["status"],
+        ))
+
+    if not console.is_terminal:
+        _echo_tsv(("pattern_id", "loaded_version", "stored_version", "scans", "status"), rows)
+        return
+
+    table = Table(show_header=True, header_style="bold dim", padding=(0, 1), highlight=False)
+    table.add_column("Pattern ID", style="cyan", width=28, no_wrap=True)
     table.add_column("Loaded v", justify="right", width=9)
     table.add_column("Stored v", justify="right", width=9)
     table.add_column("Scans", justify="right", width=7)
     table.add_column("Status", width=10)
-
-    any_stale = False
-    for pattern_id, loaded_version in sorted(loaded.items()):
-        row = stored.get(pattern_id)
-        if row is None:
-            status = Text("new", style="yellow")
-            stored_v = "—"
-            scans = "0"
-        elif row["max_stored_version"] < loaded_version:
-            status = Text("STALE", style="bold red")
-            stored_v = str(row["max_stored_version"])
-            scans = str(row["scan_count"])
-            any_stale = True
-        else:
-            status = Text("ok", style="green")
-            stored_v = str(row["max_stored_version"])
-            scans = str(row["scan_count"])
-        table.add_row(pattern_id, str(loaded_version), stored_v, scans, status)
+    for *cells, status in rows:
+        table.add_row(*map(Text, cells), Text(status, style=status_styles[status]))
 
     console.print(table)
     if any_stale:
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import asyncio
-import time
+import os
+import sqlite3
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import click
@@ -10,15 +13,30 @@ from rich.console import Console
 from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
 
 from aidar.cli.main import aidar
-from aidar.core.fetcher import FetchError, fetch_url_async, count_words
+from aidar.core.analyzer import Analyzer
+from aidar.core.fetcher import (
+    FetchError,
+    FetchResult,
+    _extract,
+    fetch_html_async,
+    make_async_client,
+)
+from aidar.core.limiter import THROTTLE_STATUSES, DomainLimiter
 from aidar.core.scorer import compute_aggregate
-from aidar.output.formatters import to_json_list
+from aidar.db.queries import bulk_store_results
+from aidar.models.config import AppConfig
+from aidar.models.result import AggregateResult
+from aidar.output.formatters import to_json_list, to_jsonl
 from aidar.output.renderer import render_comparison_table
 
-import trafilatura
-
 console = Console()
 
+# Results written per transaction by _bulk_scan's writer stage
+_STORE_BATCH = 50
+
+# Per-host request rate when no --delay is given; backs off on 429/503
+_DEFAULT_HOST_RATE = 20.0
+
 
 @aidar.command()
 @click.option(
@@ -66,6 +84,12 @@ console = Console()
     show_default=True,
     help="Skip pages with fewer than this many extracted words (nav pages, stubs, etc.)",
 )
+@click.option(
+    "--plain",
+    is_flag=True,
+    default=False,
+    help="Fixed-width results table without Rich layout (faster for long lists, logs, CI)",
+)
 @click.pass_context
 def scan(
     ctx: click.Context,
@@ -76,6 +100,7 @@ def scan(
     skip_existing: bool,
     delay: float,
     min_words: int,
+    plain: bool,
 ) -> None:
     """Async bulk scan of URLs from a batch file."""
     urls = _load_urls(batch_file)
@@ -91,11 +116,13 @@ def scan(
     conn = None
     if save:
         from aidar.db.database import get_connection
-        from aidar.db.queries import url_already_scanned
-        conn = get_connection(db_path)
+        from aidar.db.queries import bulk_urls_already_scanned
+        # The _bulk_scan writer stage stores from a worker thread
+        conn = get_connection(db_path, check_same_thread=False)
         if skip_existing:
             before = len(urls)
-            urls = [u for u in urls if not url_already_scanned(conn, u)]
+            scanned = bulk_urls_already_scanned(conn, urls)
+            urls = [u for u in urls if u not in scanned]
             skipped = before - len(urls)
             if skipped:
                 console.print(f"[dim]Skipping {skipped} already-scanned URLs.[/dim]")
@@ -105,23 +132,25 @@ def scan(
         return
 
     console.print(f"[bold]Scanning {len(urls)} URLs (concurrency={concurrency}, min-words={min_words})...[/bold]")
+    stats: dict[str, int] = {}
     results = asyncio.run(
-        _bulk_scan(urls, analyzer, config, concurrency, delay, min_words)
+        _bulk_scan(urls, analyzer, config, concurrency, delay, min_words, conn=conn, stats=stats)
     )
 
     if save and conn:
-        from aidar.db.queries import store_result
-        for result in results:
-            store_result(conn, result)
         console.print(f"[green]Saved {len(results)} results to {db_path}[/green]")
 
     if output_format == "json":
         import click as _click
         _click.echo(to_json_list(results))
+    elif output_format == "jsonl":
+        to_jsonl(results, sys.stdout)
     else:
         from aidar.core.comparator import rank_results
-        render_comparison_table(rank_results(results))
+        render_comparison_table(rank_results(results), plain=plain)
         console.print(f"\n[bold]Total scanned:[/bold] {len(results)}")
+        if stats["short_skipped"]:
+            console.print(f"[dim]Skipped {stats['short_skipped']} pages under --min-words.[/dim]")
 
 
 def _load_urls(path: str) -> list[str]:
@@ -129,9 +158,53 @@ def _load_urls(path: str) -> list[str]:
     return [l.strip() for l in lines if l.strip() and not l.startswith("#")]
 
 
-async def _bulk_scan(urls, analyzer, config, concurrency, delay, min_words=50):
-    semaphore = asyncio.Semaphore(concurrency)
-    results = []
+async def _bulk_scan(
+    urls: list[str],
+    analyzer: Analyzer,
+    config: AppConfig,
+    concurrency: int,
+    delay: float,
+    min_words: int = 50,
+    description: str = "Scanning...",
+    conn: sqlite3.Connection | None = None,
+    stats: dict[str, int] | None = None,
+) -> list[AggregateResult]:
+    """
+    Fetch, extract and score URLs as a three-stage pipeline.
+
+    Fetchers push raw HTML onto a queue, a process pool runs trafilatura
+    extraction off the event loop, and a single consumer scores the extracted
+    text in a worker thread. Network latency and extraction CPU overlap
+    instead of running back to back inside each URL's semaphore slot.
+
+    Requests are paced per host by a DomainLimiter: `delay` > 0 caps each
+    host at one request per `delay` seconds, otherwise at _DEFAULT_HOST_RATE.
+    A host answering 429/503 gets its rate halved and the URL retried once.
+
+    When `conn` is given, a writer stage persists results in batches of
+    _STORE_BATCH (one transaction each, in a worker thread, so `conn` must be
+    opened with check_same_thread=False) while the scan is still running.
+    Pages below `min_words` (or the analyzer's scoring floor) are dropped
+    unscored and counted in stats["short_skipped"].
+    """
+    results: list[AggregateResult] = []
+    if stats is None:
+        stats = {}
+    stats["short_skipped"] = 0
+    loop = asyncio.get_running_loop()
+    workers = max(1, min(os.cpu_count() or 1, concurrency))
+
+    url_q: asyncio.Queue[str] = asyncio.Queue()
+    for url in urls:
+        url_q.put_nowait(url)
+    fetch_q: asyncio.Queue[tuple[str, str] | None] = asyncio.Queue(maxsize=concurrency * 2)
+    score_q: asyncio.Queue[tuple[str, FetchResult] | None] = asyncio.Queue(maxsize=concurrency * 2)
+    store_q: asyncio.Queue[AggregateResult | None] = asyncio.Queue()
+    if delay > 0:
+        limiter = DomainLimiter(1.0 / delay, burst=1)
+    else:
+        limiter = DomainLimiter(_DEFAULT_HOST_RATE, burst=concurrency)
+    retried: set[str] = set()
 
     with Progress(
         SpinnerColumn(),
@@ -139,45 +212,100 @@ async def _bulk_scan(urls, analyzer, config, concurrency, delay, min_words=50):
         BarColumn(),
         TaskProgressColumn(),
         console=console,
-    ) as progress:
-        task = progress.add_task("Scanning...", total=len(urls))
-
-        async with httpx.AsyncClient(timeout=30) as client:
-            tasks = [
-                _scan_one(url, analyzer, config, client, semaphore, delay, progress, task, min_words)
-                for url in urls
-            ]
-            raw_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-    for r in raw_results:
-        if isinstance(r, Exception):
-            continue
-        if r is not None:
-            results.append(r)
+    ) as progress, ProcessPoolExecutor(max_workers=workers) as pool:
+        task = progress.add_task(description, total=len(urls))
+
+        async def fetcher(client: httpx.AsyncClient) -> None:
+            while True:
+                try:
+                    url = url_q.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    await limiter.acquire(url)
+                    html = await fetch_html_async(url, client)
+                except FetchError as e:
+                    limiter.record(url, e.status_code)
+                    if e.status_code in THROTTLE_STATUSES and url not in retried:
+                        retried.add(url)
+                        url_q.put_nowait(url)
+                    else:
+                        progress.advance(task)
+                    continue
+                except Exception:
+                    progress.advance(task)
+                    continue
+                # fetch_html_async raises FetchError for anything but a 2xx
+                limiter.record(url, 200)
+                await fetch_q.put((url, html))
+
+        async def extractor() -> None:
+            while (item := await fetch_q.get()) is not None:
+                url, html = item
+                try:
+                    fetch = await loop.run_in_executor(pool, _extract, html)
+                except Exception:
+                    fetch = None
+                if fetch is None:
+                    progress.advance(task)
+                    continue
+                await score_q.put((url, fetch))
+
+        async def scorer() -> None:
+            while (item := await score_q.get()) is not None:
+                url, fetch = item
+                try:
+                    if fetch.word_count < min_words:
+                        stats["short_skipped"] += 1
+                        continue
+                    result = await asyncio.to_thread(_score_fetch, url, fetch, analyzer, config)
+                    if result.score_vector.skipped:
+                        stats["short_skipped"] += 1
+                        continue
+                    results.append(result)
+                    if conn is not None:
+                        store_q.put_nowait(result)
+                except Exception:
+                    pass
+                finally:
+                    progress.advance(task)
+
+        async def writer(conn: sqlite3.Connection) -> None:
+            batch: list[AggregateResult] = []
+            while (result := await store_q.get()) is not None:
+                batch.append(result)
+                if len(batch) >= _STORE_BATCH:
+                    await asyncio.to_thread(bulk_store_results, conn, batch)
+                    batch = []
+            if batch:
+                await asyncio.to_thread(bulk_store_results, conn, batch)
+
+        async with make_async_client(concurrency) as client:
+            writer_task = asyncio.create_task(writer(conn)) if conn is not None else None
+            scorer_task = asyncio.create_task(scorer())
+            extractors = [asyncio.create_task(extractor()) for _ in range(workers)]
+            n_fetchers = max(1, min(concurrency, len(urls)))
+            await asyncio.gather(*(fetcher(client) for _ in range(n_fetchers)))
+            for _ in extractors:
+                await fetch_q.put(None)
+            await asyncio.gather(*extractors)
+            await score_q.put(None)
+            await scorer_task
+            if writer_task is not None:
+                store_q.put_nowait(None)
+                await writer_task
 
     return results
 
 
-async def _scan_one(url, analyzer, config, client, semaphore, delay, progress, task_id, min_words=50):
-    async with semaphore:
-        try:
-            if delay > 0:
-                await asyncio.sleep(delay)
-            fetch = await fetch_url_async(url, client)
-            if fetch.word_count < min_words:
-                return None
-            score_vector = analyzer.run(fetch.text, fetch.word_count, raw_html=fetch.raw_html)
-            result = compute_aggregate(
-                score_vector, config,
-                url=url,
-                word_count=fetch.word_count,
-                published_date=fetch.published_date,
-                title=fetch.title,
-            )
-            return result
-        except FetchError:
-            return None
-        except Exception:
-            return None
-        finally:
-            progress.advance(task_id)
+def _score_fetch(
+    url: str, fetch: FetchResult, analyzer: Analyzer, config: AppConfig
+) -> AggregateResult:
+    score_vector = analyzer.run(fetch.text, fetch.word_count, raw_html=fetch.raw_html)
+    return compute_aggregate(
+        score_vector, config,
+        url=url,
+        word_count=fetch.word_count,
+        published_date=fetch.published_date,
+        title=fetch.title,
+    )
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import os
+
+import click
+
+from aidar.cli.main import aidar
+from aidar.output.renderer import console
+
+
+@aidar.command("rebuild-stats")
+@click.option("--db", "db_path", default="aidar.db", show_default=True)
+def rebuild_stats(db_path: str) -> None:
+    """Recompute the per-domain stats table from every stored scan.
+
+    Writes keep it current on their own; run this after editing scans by
+    hand or restoring a database copied without its triggers.
+    """
+    from aidar.db.database import get_connection, rebuild_domain_stats
+
+    if not os.path.exists(db_path):
+        console.print(f"[yellow]No database found at {db_path}.[/yellow]")
+        return
+
+    conn = get_connection(db_path)
+    domains = rebuild_domain_stats(conn)
+    console.print(f"[green]Rebuilt stats for {domains} domains in {db_path}[/green]")
@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 import asyncio
-from urllib.parse import urlparse
+import re
+import sqlite3
 
 import click
-import httpx
 
-from aidar.cli.discover import _from_rss, _from_sitemap, _normalize_domain
+from aidar.cli.discover import _from_rss, _from_sitemap, _normalize_domain, _parse_cached
 from aidar.cli.main import aidar
-from aidar.cli.scan import _scan_one
+from aidar.cli.scan import _bulk_scan
 from aidar.output.renderer import console
 
 
@@ -115,15 +115,14 @@ def run_track_domain(
     Returns summary counters for observability.
     """
     base_url = _normalize_domain(domain)
-    domain_name = urlparse(base_url).netloc
+    domain_name = _parse_cached(base_url).netloc
 
     console.print(f"\n[bold]Tracking:[/bold] {domain_name}")
     console.print("[dim]Discovering URLs...[/dim]")
 
     from aidar.db.database import get_connection
-    from aidar.db.queries import store_result, url_already_scanned
-
-    conn = get_connection(db_path)
+    # _bulk_scan's writer stage stores from a worker thread
+    conn = get_connection(db_path, check_same_thread=False)
 
     urls: list[str] = []
     if source in ("auto", "sitemap"):
@@ -139,7 +138,8 @@ def run_track_domain(
 
     if skip_patterns:
         before = len(urls)
-        urls = [u for u in urls if not any(p in u for p in skip_patterns)]
+        skip_re = re.compile("|".join(re.escape(p) for p in skip_patterns))
+        urls = [u for u in urls if not skip_re.search(u)]
         filtered = before - len(urls)
         if filtered:
             console.print(f"[dim]Filtered {filtered} URLs matching skip patterns.[/dim]")
@@ -156,14 +156,17 @@ def run_track_domain(
             console.print(
                 f"[yellow]{len(stale)} URLs stale (pattern changed) — forcing rescan.[/yellow]"
             )
-            urls = list(stale | set(u for u in urls if not url_already_scanned(conn, u)))
+            scanned = _scanned_among(conn, urls, domain_name)
+            urls = list(stale | set(u for u in urls if u not in scanned))
         else:
             console.print("[dim]No stale URLs found.[/dim]")
             if skip_existing:
-                urls = [u for u in urls if not url_already_scanned(conn, u)]
+                scanned = _scanned_among(conn, urls, domain_name)
+                urls = [u for u in urls if u not in scanned]
     elif skip_existing:
         before = len(urls)
-        urls = [u for u in urls if not url_already_scanned(conn, u)]
+        scanned = _scanned_among(conn, urls, domain_name)
+        urls = [u for u in urls if u not in scanned]
         skipped = before - len(urls)
         if skipped:
             console.print(f"[dim]Skipping {skipped} already-scanned URLs.[/dim]")
@@ -180,35 +183,36 @@ def run_track_domain(
     urls = urls[:limit]
     console.print(f"[bold]Scanning {len(urls)} URLs (concurrency={concurrency})...[/bold]\n")
 
-    from rich.progress import Progress, SpinnerColumn, BarColumn, TaskProgressColumn, TextColumn
-
-    async def run():
-        semaphore = asyncio.Semaphore(concurrency)
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=console,
-        ) as progress:
-            task = progress.add_task(f"Scanning {domain_name}...", total=len(urls))
-            async with httpx.AsyncClient(timeout=30) as client:
-                tasks = [
-                    _scan_one(url, analyzer, config, client, semaphore, 0.0, progress, task)
-                    for url in urls
-                ]
-                raw = await asyncio.gather(*tasks, return_exceptions=True)
-        return [r for r in raw if r is not None and not isinstance(r, Exception)]
-
-    results = asyncio.run(run())
-    for result in results:
-        store_result(conn, result)
+    results = asyncio.run(
+        _bulk_scan(
+            urls, analyzer, config, concurrency, 0.0,
+            description=f"Scanning {domain_name}...", conn=conn,
+        )
+    )
 
     console.print(f"\n[green]Saved {len(results)} results to {db_path}[/green]")
     _print_domain_summary(conn, domain_name)
     return {"status": "scanned", "discovered": discovered_count, "queued": len(urls), "saved": len(results)}
 
 
+def _scanned_among(conn: sqlite3.Connection, urls: list[str], domain_name: str) -> set[str]:
+    """
+    Return which of `urls` are already stored.
+
+    Loads the domain's stored URLs once and answers membership in memory;
+    only URLs on another host (e.g. www. vs apex in the sitemap) fall back
+    to chunked IN lookups.
+    """
+    from aidar.db.queries import bulk_urls_already_scanned, get_scanned_urls
+
+    known = get_scanned_urls(conn, domain_name)
+    scanned = {u for u in urls if u in known}
+    elsewhere = [u for u in urls if u not in known and _parse_cached(u).netloc != domain_name]
+    if elsewhere:
+        scanned |= bulk_urls_already_scanned(conn, elsewhere)
+    return scanned
+
+
 def _print_domain_summary(conn, domain: str) -> None:
     from aidar.db.queries import get_domain_stats
     stats = get_domain_stats(conn, domain)
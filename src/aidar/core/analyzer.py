@@ -1,50 +1,88 @@
 from __future__ import annotations
 
 from aidar.models.result import PatternResult, ScoreVector
+from aidar.patterns.detectors.base import BaseDetector, ScanContext
 from aidar.patterns.registry import PatternRegistry
 
+_CATEGORIES = ("tropes", "punctuation", "phrases", "structure", "emoji", "vocabulary")
+_CATEGORY_SLOT = {cat: i for i, cat in enumerate(_CATEGORIES)}
+
 
 class Analyzer:
-    def __init__(self, registry: PatternRegistry) -> None:
+    """Runs every registry pattern over a text and folds the results into a ScoreVector."""
+
+    def __init__(self, registry: PatternRegistry, min_words: int = 0) -> None:
         self.registry = registry
+        self.min_words = min_words
+        self._plan: list[tuple[BaseDetector, int | None]] | None = None
 
-    def run(self, text: str, word_count: int, raw_html: str | None = None) -> ScoreVector:
-        """Run all patterns against text, aggregate into ScoreVector."""
-        results: list[PatternResult] = []
+    def invalidate(self) -> None:
+        """Drop the run plan so the next run() rebuilds it — call after mutating the registry."""
+        self._plan = None
 
+    def _build_plan(self) -> list[tuple[BaseDetector, int | None]]:
+        """
+        Resolve the run plan on first use, so building an analyzer compiles nothing.
+
+        The plan is a flat list of (detector, category slot) in registry order,
+        resolved once so run() makes no registry calls and accumulates by index
+        instead of hashing category names per result. Patterns outside
+        _CATEGORIES get slot None and don't feed the vector; patterns whose
+        detector can't be built are left out, as run() used to skip them.
+        """
+        plan: list[tuple[BaseDetector, int | None]] = []
         for pattern in self.registry.all_patterns():
             try:
                 detector = self.registry.get_detector(pattern.id)
-                result = detector.detect(text, word_count, raw_html=raw_html)
-                results.append(result)
             except Exception:
-                # Skip failed patterns rather than crashing the whole analysis
-                pass
+                continue
+            plan.append((detector, _CATEGORY_SLOT.get(pattern.category)))
+        self._plan = plan
+        return plan
 
-        return self._aggregate(results)
+    @staticmethod
+    def _safe_detect(
+        detector: BaseDetector, text: str, word_count: int, raw_html: str | None, ctx: ScanContext
+    ) -> PatternResult | None:
+        try:
+            return detector.detect(text, word_count, raw_html=raw_html, ctx=ctx)
+        except Exception:
+            # Skip failed patterns rather than crashing the whole analysis
+            return None
 
-    def _aggregate(self, results: list[PatternResult]) -> ScoreVector:
-        """Compute weighted mean per category from pattern results."""
-        category_sums: dict[str, float] = {}
-        category_weight_totals: dict[str, float] = {}
+    def run(self, text: str, word_count: int, raw_html: str | None = None) -> ScoreVector:
+        """Run all patterns against text, aggregate into ScoreVector."""
+        if word_count < self.min_words:
+            # Too short for any signal to mean anything — skip every detector
+            return ScoreVector.empty("short_text")
 
-        for r in results:
-            cat = r.category
-            category_sums[cat] = category_sums.get(cat, 0.0) + r.normalized_score * r.weight
-            category_weight_totals[cat] = category_weight_totals.get(cat, 0.0) + r.weight
+        plan = self._plan if self._plan is not None else self._build_plan()
+        results: list[PatternResult] = []
+        # Per-category weighted score sums and weight totals, indexed by slot
+        score_sums = [0.0] * len(_CATEGORIES)
+        weight_totals = [0.0] * len(_CATEGORIES)
 
-        def weighted_mean(cat: str) -> float:
-            total_weight = category_weight_totals.get(cat, 0.0)
-            if total_weight == 0:
-                return 0.0
-            return category_sums.get(cat, 0.0) / total_weight
+        # One context per document: lowering/tokenizing/sentence splits are shared
+        ctx = ScanContext(text)
+        for detector, slot in plan:
+            result = self._safe_detect(detector, text, word_count, raw_html, ctx)
+            if result is None:
+                continue
+            results.append(result)
+            if slot is not None:
+                score_sums[slot] += result.normalized_score * result.weight
+                weight_totals[slot] += result.weight
 
+        tropes, punctuation, phrases, structure, emoji, vocabulary = (
+            score_sums[i] / weight_totals[i] if weight_totals[i] else 0.0
+            for i in range(len(_CATEGORIES))
+        )
         return ScoreVector(
-            tropes=weighted_mean("tropes"),
-            punctuation=weighted_mean("punctuation"),
-            phrases=weighted_mean("phrases"),
-            structure=weighted_mean("structure"),
-            emoji=weighted_mean("emoji"),
-            vocabulary=weighted_mean("vocabulary"),
+            tropes=tropes,
+            punctuation=punctuation,
+            phrases=phrases,
+            structure=structure,
+            emoji=emoji,
+            vocabulary=vocabulary,
             pattern_results=results,
         )
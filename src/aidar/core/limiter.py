@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from urllib.parse import urlsplit
+
+# Statuses that mean "slow down" rather than "this page is broken"
+THROTTLE_STATUSES = frozenset({429, 503})
+
+# Consecutive successes before a throttled bucket speeds back up
+_RECOVER_AFTER = 20
+
+
+class _Bucket:
+    __slots__ = ("ok_streak", "rate", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.ok_streak = 0
+
+
+class DomainLimiter:
+    """
+    Per-host token bucket with AIMD rate adjustment.
+
+    Each netloc gets its own bucket refilled at `rate_per_sec` up to `burst`
+    tokens, so one slow or strict origin never throttles the others. A 429/503
+    halves that host's rate (down to `min_rate`); every _RECOVER_AFTER
+    consecutive 2xx/3xx responses raise it by a quarter, never above the
+    starting rate. Other 5xx and network errors (no status) break the streak
+    without cutting the rate; other 4xx say nothing about load and are ignored.
+    """
+
+    def __init__(self, rate_per_sec: float, burst: int = 1, min_rate: float = 0.2) -> None:
+        self.max_rate = rate_per_sec
+        self.burst = max(1, burst)
+        self.min_rate = min(min_rate, rate_per_sec)
+        self._buckets: dict[str, _Bucket] = {}
+
+    def _bucket(self, netloc: str) -> _Bucket:
+        bucket = self._buckets.get(netloc)
+        if bucket is None:
+            bucket = self._buckets[netloc] = _Bucket(self.max_rate, self.burst)
+        return bucket
+
+    async def acquire(self, url: str) -> None:
+        """Wait until the URL's host has a token available, then take it."""
+        bucket = self._bucket(urlsplit(url).netloc)
+        while True:
+            now = time.monotonic()
+            bucket.tokens = min(self.burst, bucket.tokens + (now - bucket.updated) * bucket.rate)
+            bucket.updated = now
+            if bucket.tokens >= 1:
+                bucket.tokens -= 1
+                return
+            await asyncio.sleep((1 - bucket.tokens) / bucket.rate)
+
+    def record(self, url: str, status_code: int | None) -> None:
+        """Feed back a response status (None = no response) to adapt the host's rate."""
+        bucket = self._bucket(urlsplit(url).netloc)
+        if status_code in THROTTLE_STATUSES:
+            bucket.rate = max(self.min_rate, bucket.rate / 2)
+            bucket.tokens = min(bucket.tokens, 0.0)
+            bucket.ok_streak = 0
+            return
+        if status_code is None or status_code >= 500:
+            bucket.ok_streak = 0
+            return
+        if not 200 <= status_code < 400:
+            return
+        bucket.ok_streak += 1
+        if bucket.ok_streak >= _RECOVER_AFTER and bucket.rate < self.max_rate:
+            bucket.rate = min(self.max_rate, bucket.rate * 1.25)
+            bucket.ok_streak = 0
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import fields
+from pathlib import Path
+from typing import Any
+
+from aidar import __version__
+from aidar.core.analyzer import Analyzer
+from aidar.models.result import PatternResult, ScoreVector
+from aidar.patterns.registry import PatternRegistry
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    def _loads(blob: str) -> Any:
+        return orjson.loads(blob)
+except ImportError:
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
+    def _loads(blob: str) -> Any:
+        return json.loads(blob)
+
+DEFAULT_CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "aidar" / "scores.sqlite"
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS score_cache (
+    text_sha256           BLOB PRIMARY KEY,
+    registry_fingerprint  TEXT NOT NULL,
+    score_vector          TEXT NOT NULL,
+    last_used             INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_score_cache_last_used ON score_cache(last_used);
+"""
+
+# How many inserts between LRU eviction passes
+_EVICT_EVERY = 500
+
+# Hits only refresh last_used once it is this many seconds old, and the
+# refreshes are written in batches rather than one UPDATE + commit per hit
+_TOUCH_AFTER = 3600
+_TOUCH_BATCH = 200
+
+
+def registry_fingerprint(registry: PatternRegistry) -> str:
+    """
+    Signature of every loaded pattern plus the tool version.
+
+    Changes whenever any pattern definition changes, so cached vectors computed
+    with older patterns are never returned (same rule as get_stale_urls).
+    """
+    payload = sorted((p.id, p.fingerprint()) for p in registry.all_patterns())
+    blob = json.dumps([__version__, payload], separators=(",", ":"))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _text_key(text: str, word_count: int, raw_html: str | None) -> bytes:
+    h = hashlib.sha256(text.encode("utf-8", errors="surrogatepass"))
+    h.update(f"\0{word_count}\0".encode())
+    # html_regex detectors score raw_html, so it is part of the input
+    if raw_html is not None:
+        h.update(raw_html.encode("utf-8", errors="surrogatepass"))
+    return h.digest()
+
+
+_RESULT_FIELDS = tuple(f.name for f in fields(PatternResult))
+
+
+def _encode(vector: ScoreVector) -> str:
+    payload: dict[str, Any] = dict(vector.as_dict())
+    # Flat field copy; dataclasses.asdict deep-copies every value recursively
+    payload["pattern_results"] = [
+        {name: getattr(r, name) for name in _RESULT_FIELDS} for r in vector.pattern_results
+    ]
+    return _dumps(payload)
+
+
+def _decode(blob: str) -> ScoreVector:
+    payload = _loads(blob)
+    results = [PatternResult(**r) for r in payload.pop("pattern_results")]
+    return ScoreVector(**payload, pattern_results=results)
+
+
+class CachedAnalyzer(Analyzer):
+    """
+    Analyzer with a persistent SQLite LRU cache keyed by text SHA-256.
+
+    Re-scans of unchanged pages (track re-runs, overlapping compare targets)
+    return the stored ScoreVector instead of re-running every detector. If the
+    cache file can't be opened the analyzer silently runs uncached.
+    """
+
+    def __init__(
+        self,
+        registry: PatternRegistry,
+        cache_path: str | Path = DEFAULT_CACHE_PATH,
+        max_entries: int = 50_000,
+        min_words: int = 0,
+    ) -> None:
+        super().__init__(registry, min_words=min_words)
+        self.fingerprint = registry_fingerprint(registry)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._inserts = 0
+        self._touched: list[bytes] = []
+        try:
+            path = Path(cache_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn: sqlite3.Connection | None = sqlite3.connect(
+                str(path), check_same_thread=False
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+        except (OSError, sqlite3.Error):
+            self._conn = None
+
+    def run(self, text: str, word_count: int, raw_html: str | None = None) -> ScoreVector:
+        conn = self._conn
+        if conn is None or word_count < self.min_words:
+            return super().run(text, word_count, raw_html=raw_html)
+
+        key = _text_key(text, word_count, raw_html)
+        cached = self._get(conn, key)
+        if cached is not None:
+            return cached
+
+        vector = super().run(text, word_count, raw_html=raw_html)
+        self._put(conn, key, vector)
+        return vector
+
+    def _get(self, conn: sqlite3.Connection, key: bytes) -> ScoreVector | None:
+        try:
+            with self._lock:
+                row = conn.execute(
+                    "SELECT score_vector, last_used FROM score_cache "
+                    "WHERE text_sha256 = ? AND registry_fingerprint = ?",
+                    (key, self.fingerprint),
+                ).fetchone()
+                if row is None:
+                    return None
+                if row[1] < time.time() - _TOUCH_AFTER:
+                    self._touched.append(key)
+                    if len(self._touched) >= _TOUCH_BATCH:
+                        self._flush_touched(conn)
+                        conn.commit()
+            return _decode(row[0])
+        except (sqlite3.Error, ValueError, TypeError):
+            return None
+
+    def _put(self, conn: sqlite3.Connection, key: bytes, vector: ScoreVector) -> None:
+        try:
+            with self._lock:
+                conn.execute(
+                    "INSERT OR REPLACE INTO score_cache "
+                    "(text_sha256, registry_fingerprint, score_vector, last_used) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, self.fingerprint, _encode(vector), int(time.time())),
+                )
+                self._flush_touched(conn)
+                self._inserts += 1
+                if self._inserts % _EVICT_EVERY == 0:
+                    self._evict(conn)
+                conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def _flush_touched(self, conn: sqlite3.Connection) -> None:
+        """Write pending last_used refreshes; the caller commits."""
+        if not self._touched:
+            return
+        now = int(time.time())
+        conn.executemany(
+            "UPDATE score_cache SET last_used = ? WHERE text_sha256 = ?",
+            [(now, key) for key in self._touched],
+        )
+        self._touched.clear()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop least-recently-used rows beyond max_entries."""
+        conn.execute(
+            """
+            DELETE FROM score_cache WHERE text_sha256 IN (
+                SELECT text_sha256 FROM score_cache
+                ORDER BY last_used DESC
+                LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.max_entries,),
+        )
+
+    def close(self) -> None:
+        if self._conn is not None:
+            try:
+                with self._lock:
+                    self._flush_touched(self._conn)
+                    self._conn.commit()
+            except sqlite3.Error:
+                pass
+            self._conn.close()
+            self._conn = None
@@ -26,7 +26,9 @@ def compute_aggregate(
     aggregate = round(raw * 100)
     aggregate = max(0, min(100, aggregate))
 
-    if aggregate <= config.likely_human_threshold:
+    if score_vector.skipped:
+        label = "TOO SHORT"
+    elif aggregate <= config.likely_human_threshold:
         label = "LIKELY HUMAN"
     elif aggregate >= config.likely_ai_threshold:
         label = "LIKELY AI"
@@ -53,14 +55,11 @@ def compare_model_profile(
     Compare actual pattern scores against a model's known profile.
     Returns per-pattern deviation + overall similarity score.
     """
+    actual_scores = score_vector.pattern_score_map
     deviations: dict[str, float] = {}
     for pattern_id, expected in model_profile.items():
-        actual_results = [
-            r for r in score_vector.pattern_results if r.pattern_id == pattern_id
-        ]
-        if actual_results:
-            actual = actual_results[0].normalized_score
-            deviations[pattern_id] = abs(actual - expected)
+        if pattern_id in actual_scores:
+            deviations[pattern_id] = abs(actual_scores[pattern_id] - expected)
 
     if deviations:
         similarity = 1.0 - (sum(deviations.values()) / len(deviations))
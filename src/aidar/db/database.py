@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import sqlite3
 from pathlib import Path
+from urllib.parse import quote
 
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS scans (
@@ -32,27 +33,181 @@ CREATE TABLE IF NOT EXISTS pattern_scores (
 
 CREATE INDEX IF NOT EXISTS idx_scans_domain ON scans(domain);
 CREATE INDEX IF NOT EXISTS idx_scans_score ON scans(score DESC);
+CREATE INDEX IF NOT EXISTS idx_scans_label_score ON scans(label, score DESC);
 CREATE INDEX IF NOT EXISTS idx_scans_domain_scanned ON scans(domain, scanned_at DESC);
 CREATE INDEX IF NOT EXISTS idx_scans_domain_published ON scans(domain, published_date);
+CREATE INDEX IF NOT EXISTS idx_scans_domain_score ON scans(domain, score, scanned_at);
 CREATE INDEX IF NOT EXISTS idx_pattern_scores_scan ON pattern_scores(scan_id);
+CREATE INDEX IF NOT EXISTS idx_pattern_scores_stats ON pattern_scores(pattern_id, category, norm_score);
+
+-- Per-domain aggregates, kept current by the triggers below so the homepage,
+-- leaderboard and domain pages read one row per domain instead of
+-- aggregating every scan. Counters move by deltas; min/max/latest are
+-- re-read through idx_scans_domain_score / idx_scans_domain_scanned (one
+-- index probe each), which stays right when the extreme row is deleted.
+CREATE TABLE IF NOT EXISTS domain_stats (
+    domain          TEXT PRIMARY KEY,
+    pages           INTEGER NOT NULL DEFAULT 0,
+    scored          INTEGER NOT NULL DEFAULT 0,   -- pages with a non-NULL score
+    score_sum       INTEGER NOT NULL DEFAULT 0,
+    min_score       INTEGER,
+    max_score       INTEGER,
+    last_scanned    TEXT,
+    likely_ai       INTEGER NOT NULL DEFAULT 0,
+    uncertain       INTEGER NOT NULL DEFAULT 0,
+    likely_human    INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_domain_stats_insert AFTER INSERT ON scans
+WHEN NEW.domain IS NOT NULL
+BEGIN
+    INSERT INTO domain_stats (domain, pages, scored, score_sum, likely_ai, uncertain, likely_human)
+    VALUES (NEW.domain, 1, NEW.score IS NOT NULL, IFNULL(NEW.score, 0),
+            NEW.label IS 'LIKELY AI', NEW.label IS 'UNCERTAIN', NEW.label IS 'LIKELY HUMAN')
+    ON CONFLICT(domain) DO UPDATE SET
+        pages = pages + 1,
+        scored = scored + excluded.scored,
+        score_sum = score_sum + excluded.score_sum,
+        likely_ai = likely_ai + excluded.likely_ai,
+        uncertain = uncertain + excluded.uncertain,
+        likely_human = likely_human + excluded.likely_human;
+    UPDATE domain_stats SET
+        min_score = (SELECT MIN(score) FROM scans WHERE domain = NEW.domain),
+        max_score = (SELECT MAX(score) FROM scans WHERE domain = NEW.domain),
+        last_scanned = (SELECT MAX(scanned_at) FROM scans WHERE domain = NEW.domain)
+    WHERE domain = NEW.domain;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_domain_stats_delete AFTER DELETE ON scans
+WHEN OLD.domain IS NOT NULL
+BEGIN
+    UPDATE domain_stats SET
+        pages = pages - 1,
+        scored = scored - (OLD.score IS NOT NULL),
+        score_sum = score_sum - IFNULL(OLD.score, 0),
+        likely_ai = likely_ai - (OLD.label IS 'LIKELY AI'),
+        uncertain = uncertain - (OLD.label IS 'UNCERTAIN'),
+        likely_human = likely_human - (OLD.label IS 'LIKELY HUMAN'),
+        min_score = (SELECT MIN(score) FROM scans WHERE domain = OLD.domain),
+        max_score = (SELECT MAX(score) FROM scans WHERE domain = OLD.domain),
+        last_scanned = (SELECT MAX(scanned_at) FROM scans WHERE domain = OLD.domain)
+    WHERE domain = OLD.domain;
+    DELETE FROM domain_stats WHERE domain = OLD.domain AND pages <= 0;
+END;
+
+-- Upserts of an already-scanned URL land here (ON CONFLICT DO UPDATE)
+CREATE TRIGGER IF NOT EXISTS trg_domain_stats_update
+AFTER UPDATE OF domain, score, label, scanned_at ON scans
+BEGIN
+    UPDATE domain_stats SET
+        pages = pages - 1,
+        scored = scored - (OLD.score IS NOT NULL),
+        score_sum = score_sum - IFNULL(OLD.score, 0),
+        likely_ai = likely_ai - (OLD.label IS 'LIKELY AI'),
+        uncertain = uncertain - (OLD.label IS 'UNCERTAIN'),
+        likely_human = likely_human - (OLD.label IS 'LIKELY HUMAN')
+    WHERE domain = OLD.domain;
+    INSERT INTO domain_stats (domain, pages, scored, score_sum, likely_ai, uncertain, likely_human)
+    SELECT NEW.domain, 1, NEW.score IS NOT NULL, IFNULL(NEW.score, 0),
+           NEW.label IS 'LIKELY AI', NEW.label IS 'UNCERTAIN', NEW.label IS 'LIKELY HUMAN'
+    WHERE NEW.domain IS NOT NULL
+    ON CONFLICT(domain) DO UPDATE SET
+        pages = pages + 1,
+        scored = scored + excluded.scored,
+        score_sum = score_sum + excluded.score_sum,
+        likely_ai = likely_ai + excluded.likely_ai,
+        uncertain = uncertain + excluded.uncertain,
+        likely_human = likely_human + excluded.likely_human;
+    DELETE FROM domain_stats WHERE domain = OLD.domain AND pages <= 0;
+    UPDATE domain_stats SET
+        min_score = (SELECT MIN(score) FROM scans WHERE domain = domain_stats.domain),
+        max_score = (SELECT MAX(score) FROM scans WHERE domain = domain_stats.domain),
+        last_scanned = (SELECT MAX(scanned_at) FROM scans WHERE domain = domain_stats.domain)
+    WHERE domain IN (OLD.domain, NEW.domain);
+END;
 """
 
+_REBUILD_DOMAIN_STATS_SQL = """
+    DELETE FROM domain_stats;
+    INSERT INTO domain_stats
+        (domain, pages, scored, score_sum, min_score, max_score, last_scanned,
+         likely_ai, uncertain, likely_human)
+    SELECT domain,
+           COUNT(*),
+           COUNT(score),
+           IFNULL(SUM(score), 0),
+           MIN(score),
+           MAX(score),
+           MAX(scanned_at),
+           SUM(label IS 'LIKELY AI'),
+           SUM(label IS 'UNCERTAIN'),
+           SUM(label IS 'LIKELY HUMAN')
+    FROM scans
+    WHERE domain IS NOT NULL
+    GROUP BY domain;
+"""
+
+
+# Per-connection settings that also apply to read-only connections
+_READ_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",    # 256 MiB memory-mapped reads
+    "PRAGMA cache_size=-65536",      # 64 MiB page cache
+    "PRAGMA busy_timeout=5000",
+)
+
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",     # fsync at checkpoints, not on every commit (safe under WAL)
+    *_READ_PRAGMAS,
+    "PRAGMA foreign_keys=ON",
+)
+
 
-def get_connection(db_path: str | Path = "aidar.db") -> sqlite3.Connection:
+def get_connection(
+    db_path: str | Path = "aidar.db", *, check_same_thread: bool = True
+) -> sqlite3.Connection:
     """Open (or create) the SQLite database and ensure schema exists."""
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA synchronous=NORMAL")
-    conn.execute("PRAGMA temp_store=MEMORY")
-    conn.execute("PRAGMA busy_timeout=5000")
-    conn.execute("PRAGMA foreign_keys=ON")
+    # Implicit write transactions open with BEGIN IMMEDIATE: the write lock is taken
+    # (waiting up to busy_timeout) before the first statement, so a transaction
+    # that read first can't fail with SQLITE_BUSY when it later upgrades to write.
+    conn = sqlite3.connect(
+        str(db_path), isolation_level="IMMEDIATE", check_same_thread=check_same_thread
+    )
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
     conn.executescript(SCHEMA)
     _migrate(conn)
     conn.commit()
     return conn
 
 
+def connect_readonly(db_path: str | Path, *, check_same_thread: bool = True) -> sqlite3.Connection:
+    """
+    Open an existing database read-only (mode=ro). No schema or migration work.
+
+    Under WAL these never block the writer or each other; the database must
+    already have been opened once with get_connection.
+    """
+    uri = "file:" + quote(str(Path(db_path).resolve())) + "?mode=ro"
+    conn = sqlite3.connect(uri, uri=True, check_same_thread=check_same_thread)
+    for pragma in _READ_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def rebuild_domain_stats(conn: sqlite3.Connection) -> int:
+    """
+    Recompute domain_stats from scratch from scans. Returns the domain count.
+
+    The triggers keep it current on every write; this is for backfilling
+    databases created before the table existed, or repairing one edited
+    with triggers disabled.
+    """
+    conn.executescript(f"BEGIN; {_REBUILD_DOMAIN_STATS_SQL} COMMIT;")
+    return int(conn.execute("SELECT COUNT(*) FROM domain_stats").fetchone()[0])
+
+
 def _migrate(conn: sqlite3.Connection) -> None:
     """Apply additive schema migrations for existing databases."""
     ps_cols = {row[1] for row in conn.execute("PRAGMA table_info(pattern_scores)").fetchall()}
@@ -74,6 +229,21 @@ def _migrate(conn: sqlite3.Connection) -> None:
         """
         CREATE INDEX IF NOT EXISTS idx_scans_domain_scanned ON scans(domain, scanned_at DESC);
         CREATE INDEX IF NOT EXISTS idx_scans_domain_published ON scans(domain, published_date);
+        -- Per-domain ORDER BY score (either direction) without a sort; also covers
+        -- get_domain_leaderboard's GROUP BY domain / AVG(score) / MAX(scanned_at)
+        CREATE INDEX IF NOT EXISTS idx_scans_domain_score ON scans(domain, score, scanned_at);
+        -- get_leaderboard with a label filter: index range walk instead of scanning every score
+        CREATE INDEX IF NOT EXISTS idx_scans_label_score ON scans(label, score DESC);
         CREATE INDEX IF NOT EXISTS idx_pattern_scores_pattern ON pattern_scores(pattern_id, pattern_version, pattern_hash, scan_id);
+        -- Covering index for get_pattern_stats: AVG/COUNT per pattern is an index-only walk
+        CREATE INDEX IF NOT EXISTS idx_pattern_scores_stats ON pattern_scores(pattern_id, category, norm_score);
         """
     )
+
+    # Backfill domain_stats for databases that predate it
+    (missing,) = conn.execute(
+        "SELECT EXISTS(SELECT 1 FROM scans WHERE domain IS NOT NULL)"
+        " AND NOT EXISTS(SELECT 1 FROM domain_stats)"
+    ).fetchone()
+    if missing:
+        rebuild_domain_stats(conn)
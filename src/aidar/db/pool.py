@@ -0,0 +1,86 @@
+"""
+Connection pooling for long-lived processes (the web app): one writer, N readers.
+
+WAL lets any number of readers run alongside a single writer, so reads come
+from a bounded pool of read-only connections while every write goes through
+one shared connection, serialized by a lock. Connections are opened once and
+reused instead of re-running schema setup on every request.
+"""
+from __future__ import annotations
+
+import queue
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from aidar.db.database import connect_readonly, get_connection
+
+
+class WriterConn:
+    """The single write connection, handed to one thread at a time."""
+
+    def __init__(self, db_path: str | Path) -> None:
+        # Opened eagerly: this is what creates and migrates the schema
+        self._conn = get_connection(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            yield self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class ReaderPool:
+    """
+    Up to `size` read-only connections, opened on demand and reused.
+
+    connection() blocks when all of them are checked out.
+    """
+
+    def __init__(self, db_path: str | Path, size: int = 4) -> None:
+        self.db_path = db_path
+        self.size = size
+        self._idle: queue.Queue[sqlite3.Connection] = queue.Queue(maxsize=size)
+        self._opened = 0
+        self._lock = threading.Lock()
+
+    def _checkout(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._opened < self.size:
+                self._opened += 1
+                open_new = True
+            else:
+                open_new = False
+        if open_new:
+            try:
+                return connect_readonly(self.db_path, check_same_thread=False)
+            except Exception:
+                with self._lock:
+                    self._opened -= 1
+                raise
+        return self._idle.get()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        conn = self._checkout()
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
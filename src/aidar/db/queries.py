@@ -2,10 +2,133 @@ from __future__ import annotations
 
 import json
 import sqlite3
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from typing import Any
 from urllib.parse import urlparse
 
 from aidar.models.result import AggregateResult
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+# SQLite's default SQLITE_MAX_VARIABLE_NUMBER on older builds is 999
+_IN_CHUNK = 900
+
+_UPSERT_SCAN_SQL = """
+    INSERT INTO scans
+        (url, domain, file_path, word_count, score, label, score_json,
+         scanned_at, published_date, title)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(url) DO UPDATE SET
+        word_count=excluded.word_count,
+        score=excluded.score,
+        label=excluded.label,
+        score_json=excluded.score_json,
+        scanned_at=excluded.scanned_at,
+        published_date=COALESCE(excluded.published_date, scans.published_date),
+        title=COALESCE(excluded.title, scans.title)
+"""
+
+# RETURNING (SQLite >= 3.35) hands back the inserted-or-updated row id directly
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+_UPSERT_SCAN_RETURNING_SQL = _UPSERT_SCAN_SQL.rstrip() + "\n    RETURNING id\n"
+
+_INSERT_PATTERN_SQL = (
+    "INSERT INTO pattern_scores "
+    "(scan_id, pattern_id, category, raw_value, norm_score, pattern_version, pattern_hash) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+_SCAN_ID_SQL = "SELECT id FROM scans WHERE url = ?"
+_DELETE_PATTERNS_SQL = "DELETE FROM pattern_scores WHERE scan_id = ?"
+
+
+def _dicts(cur: sqlite3.Cursor) -> list[dict[str, Any]]:
+    """
+    Materialize rows as dicts keyed by column name.
+
+    Connections return plain tuples; only outward-facing rows pay for dicts,
+    with the column names read from cursor.description once per query.
+    """
+    cols = [d[0] for d in cur.description]
+    return [dict(zip(cols, row)) for row in cur]
+
+
+def _chunks(items: list[Any], size: int = _IN_CHUNK) -> Iterator[list[Any]]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+@lru_cache(maxsize=4096)
+def _netloc(url: str) -> str:
+    # Rescans upsert the same URLs again, so most stores skip the parse
+    return urlparse(url).netloc
+
+
+def _scan_row(result: AggregateResult) -> tuple[Any, ...]:
+    domain = _netloc(result.url) if result.url else ""
+
+    score_json = _dumps(result.score_vector.as_dict())
+    return (
+        result.url,
+        domain,
+        result.file_path,
+        result.word_count,
+        result.aggregate_score,
+        result.label,
+        score_json,
+        result.scanned_at.isoformat(),
+        result.published_date,
+        result.title,
+    )
+
+
+def _pattern_rows(scan_id: int, result: AggregateResult) -> Iterator[tuple[Any, ...]]:
+    # A generator: executemany pulls rows one at a time, no intermediate list
+    return (
+        (
+            scan_id,
+            r.pattern_id,
+            r.category,
+            r.raw_value,
+            r.normalized_score,
+            r.pattern_version,
+            r.pattern_hash,
+        )
+        for r in result.score_vector.pattern_results
+    )
+
+
+def _store_one(conn: sqlite3.Connection, result: AggregateResult) -> int:
+    """Upsert one result and replace its pattern scores. Caller owns the transaction."""
+    if _HAS_RETURNING:
+        scan_id = conn.execute(_UPSERT_SCAN_RETURNING_SQL, _scan_row(result)).fetchone()[0]
+    else:
+        cur = conn.execute(_UPSERT_SCAN_SQL, _scan_row(result))
+        if result.url is None:
+            # NULL urls never conflict, so this was a plain insert
+            scan_id = cur.lastrowid
+        else:
+            # lastrowid is unreliable for ON CONFLICT DO UPDATE
+            scan_id = conn.execute(_SCAN_ID_SQL, (result.url,)).fetchone()[0]
+
+    # Delete old pattern scores for this scan (in case of update). NULL urls never
+    # conflict, so those rows are always new and have nothing to delete.
+    if result.url is not None:
+        conn.execute(_DELETE_PATTERNS_SQL, (scan_id,))
+
+    # Insert fresh pattern scores with version
+    conn.executemany(_INSERT_PATTERN_SQL, _pattern_rows(scan_id, result))
+    return scan_id
+
 
 def store_result(conn: sqlite3.Connection, result: AggregateResult) -> int:
     """
@@ -13,70 +136,63 @@ def store_result(conn: sqlite3.Connection, result: AggregateResult) -> int:
     If the URL already exists, updates the existing row.
     Returns the scan row id.
     """
-    domain = ""
-    if result.url:
-        parsed = urlparse(result.url)
-        domain = parsed.netloc
+    with conn:
+        return _store_one(conn, result)
 
-    score_json = json.dumps(result.score_vector.as_dict())
 
-    conn.execute(
-        """
-        INSERT INTO scans
-            (url, domain, file_path, word_count, score, label, score_json,
-             scanned_at, published_date, title)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ON CONFLICT(url) DO UPDATE SET
-            word_count=excluded.word_count,
-            score=excluded.score,
-            label=excluded.label,
-            score_json=excluded.score_json,
-            scanned_at=excluded.scanned_at,
-            published_date=COALESCE(excluded.published_date, scans.published_date),
-            title=COALESCE(excluded.title, scans.title)
-        """,
-        (
-            result.url,
-            domain,
-            result.file_path,
-            result.word_count,
-            result.aggregate_score,
-            result.label,
-            score_json,
-            result.scanned_at.isoformat(),
-            result.published_date,
-            result.title,
-        ),
-    )
-    # Always fetch the real ID — lastrowid is unreliable for ON CONFLICT DO UPDATE
-    scan_id = conn.execute(
-        "SELECT id FROM scans WHERE url = ? OR (url IS NULL AND file_path = ?)",
-        (result.url, result.file_path),
-    ).fetchone()[0]
+def store_results(conn: sqlite3.Connection, results: list[AggregateResult]) -> list[int]:
+    """
+    Persist results of any kind (URL or file) in a single transaction.
 
-    # Delete old pattern scores for this scan (in case of update)
-    conn.execute("DELETE FROM pattern_scores WHERE scan_id = ?", (scan_id,))
+    Same per-row semantics as store_result, one commit for the lot. For large
+    URL-keyed batches bulk_store_results is faster. Returns the scan row ids.
+    """
+    with conn:
+        return [_store_one(conn, result) for result in results]
 
-    # Insert fresh pattern scores with version
-    conn.executemany(
-        "INSERT INTO pattern_scores "
-        "(scan_id, pattern_id, category, raw_value, norm_score, pattern_version, pattern_hash) "
-        "VALUES (?, ?, ?, ?, ?, ?, ?)",
-        [
-            (
-                scan_id,
-                r.pattern_id,
-                r.category,
-                r.raw_value,
-                r.normalized_score,
-                r.pattern_version,
-                r.pattern_hash,
-            )
-            for r in result.score_vector.pattern_results
-        ],
-    )
-    conn.commit()
-    return scan_id
+
+def bulk_store_results(conn: sqlite3.Connection, results: list[AggregateResult]) -> int:
+    """
+    Persist many URL-keyed AggregateResults in one transaction.
+
+    Scan rows are upserted with a single executemany, their ids fetched back
+    with chunked IN queries, and all pattern scores replaced in one more
+    executemany — one commit for the whole batch instead of one per result.
+    Results without a URL are stored row by row, inside the same transaction.
+    Returns the number of results stored.
+    """
+    # Last result wins for duplicate URLs, matching sequential store_result calls
+    by_url: dict[str, AggregateResult] = {}
+    for result in results:
+        if result.url:
+            by_url.pop(result.url, None)
+            by_url[result.url] = result
+    unkeyed = [r for r in results if not r.url]
+
+    with conn:
+        conn.executemany(_UPSERT_SCAN_SQL, [_scan_row(r) for r in by_url.values()])
+
+        ids: dict[str, int] = {}
+        for chunk in _chunks(list(by_url)):
+            placeholders = ",".join("?" * len(chunk))
+            for row in conn.execute(
+                f"SELECT id, url FROM scans WHERE url IN ({placeholders})", chunk
+            ):
+                ids[row[1]] = row[0]
+
+        scan_ids = list(ids.values())
+        for chunk in _chunks(scan_ids):
+            placeholders = ",".join("?" * len(chunk))
+            conn.execute(f"DELETE FROM pattern_scores WHERE scan_id IN ({placeholders})", chunk)
+
+        conn.executemany(
+            _INSERT_PATTERN_SQL,
+            (row for url, r in by_url.items() for row in _pattern_rows(ids[url], r)),
+        )
+
+        for result in unkeyed:
+            _store_one(conn, result)
+    return len(by_url) + len(unkeyed)
 
 
 def get_leaderboard(
@@ -93,37 +209,42 @@ def get_leaderboard(
         params.append(label_filter)
     query += " ORDER BY score DESC LIMIT ? OFFSET ?"
     params.extend([limit, offset])
-    rows = conn.execute(query, params).fetchall()
-    return [dict(row) for row in rows]
+    return _dicts(conn.execute(query, params))
 
 
 def get_domain_stats(conn: sqlite3.Connection, domain: str) -> dict:
-    """Return aggregate stats for all scans of a domain."""
-    rows = conn.execute(
-        "SELECT score, label, scanned_at FROM scans WHERE domain = ? ORDER BY scanned_at DESC",
+    """Return aggregate stats for all scans of a domain (one domain_stats row)."""
+    cur = conn.execute(
+        """
+        SELECT pages AS scans, scored, score_sum, max_score, min_score,
+               last_scanned AS latest, likely_ai, uncertain, likely_human
+        FROM domain_stats
+        WHERE domain = ?
+        """,
         (domain,),
-    ).fetchall()
-    if not rows:
+    )
+    rows = _dicts(cur)
+    if not rows or not rows[0]["scans"]:
         return {"domain": domain, "scans": 0}
-    scores = [r["score"] for r in rows]
+    row = rows[0]
     return {
         "domain": domain,
-        "scans": len(rows),
-        "avg_score": round(sum(scores) / len(scores), 1),
-        "max_score": max(scores),
-        "min_score": min(scores),
-        "latest": rows[0]["scanned_at"],
+        "scans": row["scans"],
+        "avg_score": round(row["score_sum"] / row["scored"], 1) if row["scored"] else None,
+        "max_score": row["max_score"],
+        "min_score": row["min_score"],
+        "latest": row["latest"],
         "label_counts": {
-            "LIKELY AI": sum(1 for r in rows if r["label"] == "LIKELY AI"),
-            "UNCERTAIN": sum(1 for r in rows if r["label"] == "UNCERTAIN"),
-            "LIKELY HUMAN": sum(1 for r in rows if r["label"] == "LIKELY HUMAN"),
+            "LIKELY AI": row["likely_ai"],
+            "UNCERTAIN": row["uncertain"],
+            "LIKELY HUMAN": row["likely_human"],
         },
     }
 
 
 def get_pattern_stats(conn: sqlite3.Connection) -> list[dict]:
     """Return average normalized score per pattern across all scans."""
-    rows = conn.execute(
+    cur = conn.execute(
         """
         SELECT pattern_id, category,
                AVG(norm_score) as avg_score,
@@ -132,13 +253,36 @@ def get_pattern_stats(conn: sqlite3.Connection) -> list[dict]:
         GROUP BY pattern_id
         ORDER BY avg_score DESC
         """
-    ).fetchall()
-    return [dict(row) for row in rows]
+    )
+    return _dicts(cur)
 
 
 def url_already_scanned(conn: sqlite3.Connection, url: str) -> bool:
-    row = conn.execute("SELECT id FROM scans WHERE url = ?", (url,)).fetchone()
-    return row is not None
+    return bool(bulk_urls_already_scanned(conn, (url,)))
+
+
+def get_scanned_urls(conn: sqlite3.Connection, domain: str) -> set[str]:
+    """All stored URLs for a domain, read in one range scan of idx_scans_domain."""
+    cur = conn.execute(
+        "SELECT url FROM scans WHERE domain = ? AND url IS NOT NULL", (domain,)
+    )
+    return {row[0] for row in cur}
+
+
+def bulk_urls_already_scanned(conn: sqlite3.Connection, urls: Iterable[str]) -> set[str]:
+    """
+    Return the subset of `urls` already present in scans.
+
+    Looks them up in chunked IN queries (one round-trip per _IN_CHUNK URLs)
+    so deduping a whole input list doesn't cost one query per URL.
+    """
+    scanned: set[str] = set()
+    unique = list(dict.fromkeys(urls))
+    for chunk in _chunks(unique):
+        placeholders = ",".join("?" * len(chunk))
+        rows = conn.execute(f"SELECT url FROM scans WHERE url IN ({placeholders})", chunk)
+        scanned.update(row[0] for row in rows)
+    return scanned
 
 
 def get_stale_urls(
@@ -167,34 +311,52 @@ def get_stale_urls(
     for row in normalized:
         params.extend(row)
 
-    query = f"""
-        WITH current(pattern_id, pattern_version, pattern_hash) AS (
-            VALUES {values_sql}
+    stale_sql = """
+        ps.pattern_version < c.pattern_version
+        OR (
+            c.pattern_hash != ''
+            AND COALESCE(ps.pattern_hash, '') != c.pattern_hash
         )
-        SELECT DISTINCT s.url
-        FROM scans s
-        JOIN pattern_scores ps ON ps.scan_id = s.id
-        JOIN current c ON c.pattern_id = ps.pattern_id
-        WHERE s.url IS NOT NULL
-          AND (
-                ps.pattern_version < c.pattern_version
-                OR (
-                    c.pattern_hash != ''
-                    AND COALESCE(ps.pattern_hash, '') != c.pattern_hash
-                )
-              )
     """
     if domain:
-        query += " AND s.domain = ?"
+        # Drive from the domain's scans (idx_scans_domain) and stop at the first
+        # stale pattern per scan, instead of walking every stored score of every
+        # domain through the pattern index and filtering by domain afterwards.
+        query = f"""
+            WITH current(pattern_id, pattern_version, pattern_hash) AS (
+                VALUES {values_sql}
+            )
+            SELECT s.url
+            FROM scans s
+            WHERE s.domain = ?
+              AND s.url IS NOT NULL
+              AND EXISTS (
+                    SELECT 1
+                    FROM pattern_scores ps
+                    JOIN current c ON c.pattern_id = ps.pattern_id
+                    WHERE ps.scan_id = s.id AND ({stale_sql})
+              )
+        """
         params.append(domain)
+    else:
+        query = f"""
+            WITH current(pattern_id, pattern_version, pattern_hash) AS (
+                VALUES {values_sql}
+            )
+            SELECT DISTINCT s.url
+            FROM scans s
+            JOIN pattern_scores ps ON ps.scan_id = s.id
+            JOIN current c ON c.pattern_id = ps.pattern_id
+            WHERE s.url IS NOT NULL AND ({stale_sql})
+        """
 
     rows = conn.execute(query, params).fetchall()
-    return sorted(r["url"] for r in rows)
+    return sorted(r[0] for r in rows)
 
 
 def get_pattern_version_summary(conn: sqlite3.Connection) -> list[dict]:
     """Show which pattern versions are stored in the DB vs what's loaded."""
-    rows = conn.execute(
+    cur = conn.execute(
         """
         SELECT pattern_id,
                MAX(pattern_version) as max_stored_version,
@@ -203,13 +365,58 @@ def get_pattern_version_summary(conn: sqlite3.Connection) -> list[dict]:
         GROUP BY pattern_id
         ORDER BY pattern_id
         """
-    ).fetchall()
-    return [dict(row) for row in rows]
+    )
+    return _dicts(cur)
+
+
+def get_version_status(conn: sqlite3.Connection, loaded: dict[str, int]) -> list[dict[str, Any]]:
+    """
+    Compare loaded pattern versions against stored ones in a single query.
+
+    loaded: {pattern_id: version} from the registry. Returns one row per loaded
+    pattern with loaded_version, stored_version (None if never stored),
+    scan_count and status ('new' | 'STALE' | 'ok'), ordered by pattern_id.
+    """
+    if not loaded:
+        return []
+
+    values_sql = ",".join("(?, ?)" for _ in loaded)
+    params: list[str | int] = []
+    for pattern_id, version in loaded.items():
+        params.extend((pattern_id, int(version)))
+
+    cur = conn.execute(
+        f"""
+        WITH loaded(pattern_id, version) AS (
+            VALUES {values_sql}
+        )
+        SELECT l.pattern_id,
+               l.version AS loaded_version,
+               s.max_stored_version AS stored_version,
+               COALESCE(s.scan_count, 0) AS scan_count,
+               CASE
+                   WHEN s.max_stored_version IS NULL THEN 'new'
+                   WHEN s.max_stored_version < l.version THEN 'STALE'
+                   ELSE 'ok'
+               END AS status
+        FROM loaded l
+        LEFT JOIN (
+            SELECT pattern_id,
+                   MAX(pattern_version) AS max_stored_version,
+                   COUNT(DISTINCT scan_id) AS scan_count
+            FROM pattern_scores
+            GROUP BY pattern_id
+        ) s ON s.pattern_id = l.pattern_id
+        ORDER BY l.pattern_id
+        """,
+        params,
+    )
+    return _dicts(cur)
 
 
 def get_domain_trend(conn: sqlite3.Connection, domain: str) -> list[dict]:
     """Return scans ordered by published_date for trend charting."""
-    rows = conn.execute(
+    cur = conn.execute(
         """
         SELECT url, title, score, label, word_count,
                published_date, scanned_at
@@ -219,8 +426,22 @@ def get_domain_trend(conn: sqlite3.Connection, domain: str) -> list[dict]:
         ORDER BY published_date ASC
         """,
         (domain,),
-    ).fetchall()
-    return [dict(row) for row in rows]
+    )
+    return _dicts(cur)
+
+
+def get_domain_averages(conn: sqlite3.Connection) -> list[float]:
+    """
+    Average score of every scored domain, ascending, read from domain_stats.
+
+    Same values as AVG(score) per domain over scans (score_sum is an exact
+    integer sum), so callers can bisect instead of re-aggregating per lookup.
+    """
+    cur = conn.execute(
+        "SELECT score_sum * 1.0 / scored FROM domain_stats "
+        "WHERE domain != '' AND scored > 0 ORDER BY 1"
+    )
+    return [row[0] for row in cur]
 
 
 def get_corpus_percentile(conn: sqlite3.Connection, score: int) -> float:
@@ -243,7 +464,7 @@ def get_domain_scans(
         "highest": "score DESC",
         "lowest": "score ASC",
     }.get(sort, "scanned_at DESC")
-    rows = conn.execute(
+    cur = conn.execute(
         f"""
         SELECT url, word_count, score, label, score_json, scanned_at
         FROM scans
@@ -252,8 +473,8 @@ def get_domain_scans(
         LIMIT ?
         """,
         (domain, limit),
-    ).fetchall()
-    return [dict(row) for row in rows]
+    )
+    return _dicts(cur)
 
 
 def get_domain_extremes(
@@ -263,26 +484,27 @@ def get_domain_extremes(
 ) -> tuple[list[dict], list[dict]]:
     """Return (top_n highest scoring, top_n lowest scoring) pages for a domain."""
     base = "SELECT url, word_count, score, label, scanned_at FROM scans WHERE domain = ? AND word_count > 100"
-    highest = [dict(r) for r in conn.execute(f"{base} ORDER BY score DESC LIMIT ?", (domain, n)).fetchall()]
-    lowest = [dict(r) for r in conn.execute(f"{base} ORDER BY score ASC LIMIT ?", (domain, n)).fetchall()]
+    highest = _dicts(conn.execute(f"{base} ORDER BY score DESC LIMIT ?", (domain, n)))
+    lowest = _dicts(conn.execute(f"{base} ORDER BY score ASC LIMIT ?", (domain, n)))
     return highest, lowest
 
 
 def get_global_stats(conn: sqlite3.Connection) -> dict:
-    """Return high-level corpus stats for the homepage."""
-    row = conn.execute(
+    """Return high-level corpus stats for the homepage, summed over domain_stats."""
+    cur = conn.execute(
         """
         SELECT
-            COUNT(*) as total_scans,
-            COUNT(DISTINCT domain) as total_domains,
-            ROUND(AVG(score), 1) as avg_score,
-            SUM(CASE WHEN label = 'LIKELY AI' THEN 1 ELSE 0 END) as likely_ai,
-            SUM(CASE WHEN label = 'UNCERTAIN' THEN 1 ELSE 0 END) as uncertain,
-            SUM(CASE WHEN label = 'LIKELY HUMAN' THEN 1 ELSE 0 END) as likely_human
-        FROM scans
+            IFNULL(SUM(pages), 0) as total_scans,
+            COUNT(*) as total_domains,
+            ROUND(SUM(score_sum) * 1.0 / SUM(scored), 1) as avg_score,
+            SUM(likely_ai) as likely_ai,
+            SUM(uncertain) as uncertain,
+            SUM(likely_human) as likely_human
+        FROM domain_stats
         """
-    ).fetchone()
-    return dict(row) if row else {}
+    )
+    rows = _dicts(cur)
+    return rows[0] if rows else {}
 
 
 def delete_domain(conn: sqlite3.Connection, domain: str) -> int:
@@ -293,21 +515,20 @@ def delete_domain(conn: sqlite3.Connection, domain: str) -> int:
 
 
 def get_domain_leaderboard(conn: sqlite3.Connection, limit: int = 50) -> list[dict]:
-    """Return per-domain aggregated stats for the leaderboard."""
-    rows = conn.execute(
+    """Return per-domain aggregated stats for the leaderboard, read from domain_stats."""
+    cur = conn.execute(
         """
         SELECT
             domain,
-            COUNT(*) as pages,
-            ROUND(AVG(score), 1) as avg_score,
-            MAX(score) as max_score,
-            MAX(scanned_at) as last_scanned
-        FROM scans
+            pages,
+            ROUND(score_sum * 1.0 / scored, 1) as avg_score,
+            max_score,
+            last_scanned
+        FROM domain_stats
         WHERE domain != ''
-        GROUP BY domain
         ORDER BY avg_score DESC
         LIMIT ?
         """,
         (limit,),
-    ).fetchall()
-    return [dict(row) for row in rows]
+    )
+    return _dicts(cur)
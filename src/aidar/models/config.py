@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WeightConfig:
     tropes: float = 0.40      # AI writing tropes — heaviest signal
     phrases: float = 0.20
@@ -13,7 +14,9 @@ class WeightConfig:
     emoji: float = 0.10
 
     def validate(self) -> None:
-        total = sum([self.tropes, self.punctuation, self.phrases, self.structure, self.vocabulary, self.emoji])
+        total = math.fsum(
+            (self.tropes, self.punctuation, self.phrases, self.structure, self.vocabulary, self.emoji)
+        )
         if abs(total - 1.0) > 0.01:
             raise ValueError(f"Category weights must sum to 1.0, got {total:.3f}")
 
@@ -34,3 +37,4 @@ class AppConfig:
     weights: WeightConfig
     likely_ai_threshold: int = 30
     likely_human_threshold: int = 15
+    min_words_for_scoring: int = 20   # below this, Analyzer.run skips all detectors
@@ -10,7 +10,7 @@ Category = Literal["tropes", "punctuation", "phrases", "structure", "emoji", "vo
 Severity = Literal["low", "medium", "high"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PatternDef:
     id: str
     name: str
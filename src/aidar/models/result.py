@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class PatternResult:
     pattern_id: str
     category: str
@@ -16,7 +16,7 @@ class PatternResult:
     pattern_hash: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoreVector:
     tropes: float = 0.0
     punctuation: float = 0.0
@@ -25,6 +25,14 @@ class ScoreVector:
     emoji: float = 0.0
     vocabulary: float = 0.0
     pattern_results: list[PatternResult] = field(default_factory=list)
+    skipped: str | None = None   # set when scoring was skipped, e.g. "short_text"
+    # Backing slot for pattern_score_map (slotted classes can't use cached_property)
+    _score_map: dict[str, float] | None = field(default=None, init=False, repr=False, compare=False)
+
+    @classmethod
+    def empty(cls, reason: str) -> ScoreVector:
+        """All-zero vector for text that was not scored."""
+        return cls(skipped=reason)
 
     def as_dict(self) -> dict[str, float]:
         return {
@@ -36,11 +44,20 @@ class ScoreVector:
             "vocabulary": self.vocabulary,
         }
 
+    @property
+    def pattern_score_map(self) -> dict[str, float]:
+        """pattern_id → normalized_score (first result wins), built on first access."""
+        if self._score_map is None:
+            self._score_map = {
+                r.pattern_id: r.normalized_score for r in reversed(self.pattern_results)
+            }
+        return self._score_map
+
     def results_by_category(self, category: str) -> list[PatternResult]:
         return [r for r in self.pattern_results if r.category == category]
 
 
-@dataclass
+@dataclass(slots=True)
 class AggregateResult:
     url: str | None
     file_path: str | None
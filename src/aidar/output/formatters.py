@@ -1,13 +1,68 @@
 from __future__ import annotations
 
 import json
+import re
+from collections.abc import Iterable
+from typing import Any, TextIO
 
 from aidar.models.result import AggregateResult
 
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+
+# json.dumps escapes everything outside printable ASCII; orjson writes it raw
+_NON_ASCII = re.compile(r"[^\x00-\x7e]")
+
+
+def _escape_char(match: re.Match[str]) -> str:
+    code = ord(match.group())
+    if code > 0xFFFF:
+        code -= 0x10000
+        return f"\\u{0xD800 | (code >> 10):04x}\\u{0xDC00 | (code & 0x3FF):04x}"
+    return f"\\u{code:04x}"
+
+
+def _ascii(text: str) -> str:
+    if text.isascii() and "\x7f" not in text:
+        return text
+    return _NON_ASCII.sub(_escape_char, text)
+
+
+def _dumps(obj: Any, indent: int) -> str:
+    # orjson only supports 2-space indentation; anything else goes through stdlib
+    if _ORJSON_AVAILABLE and indent == 2:
+        return _ascii(orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode())
+    return json.dumps(obj, indent=indent)
+
+
+def _dumps_line(obj: Any) -> str:
+    if _ORJSON_AVAILABLE:
+        return _ascii(orjson.dumps(obj).decode())
+    return json.dumps(obj, separators=(",", ":"))
+
 
 def to_json(result: AggregateResult, indent: int = 2) -> str:
-    return json.dumps(result.as_dict(), indent=indent)
+    return _dumps(result.as_dict(), indent)
 
 
 def to_json_list(results: list[AggregateResult], indent: int = 2) -> str:
-    return json.dumps([r.as_dict() for r in results], indent=indent)
+    return _dumps([r.as_dict() for r in results], indent)
+
+
+def to_jsonl(results: Iterable[AggregateResult], fp: TextIO) -> int:
+    """
+    Write one compact JSON object per line to `fp`. Returns the line count.
+
+    Each result is serialized and written before the next is touched, so
+    memory stays at one result's dict however long the batch is.
+    """
+    count = 0
+    for result in results:
+        fp.write(_dumps_line(result.as_dict()))
+        fp.write("\n")
+        count += 1
+    return count
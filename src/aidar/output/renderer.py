@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
+import click
 from rich.console import Console
 from rich.panel import Panel
+from rich.style import Style
 from rich.table import Table
 from rich.text import Text
 
@@ -15,11 +19,36 @@ _LABEL_COLORS = {
     "LIKELY AI": "bold red",
     "UNCERTAIN": "bold yellow",
     "LIKELY HUMAN": "bold green",
+    "TOO SHORT": "bold dim",
 }
 
+# Parsed once: a Style passed to Text skips re-parsing the markup string per row
+_LABEL_STYLES = {label: Style.parse(spec) for label, spec in _LABEL_COLORS.items()}
+_DEFAULT_LABEL_STYLE = Style.parse("white")
+
+# SGR sequences matching _LABEL_COLORS, for the --plain comparison table
+_LABEL_ANSI = {
+    "LIKELY AI": "\x1b[1;31m",
+    "UNCERTAIN": "\x1b[1;33m",
+    "LIKELY HUMAN": "\x1b[1;32m",
+    "TOO SHORT": "\x1b[1;2m",
+}
+_ANSI_RESET = "\x1b[0m"
+
+
+# Every default-width bar, indexed by filled cell count
+_BARS = tuple("█" * i + "░" * (10 - i) for i in range(11))
+
 
 def _bar(score: float, width: int = 10) -> str:
-    filled = round(score * width)
+    filled = max(0, min(width, round(score * width)))
+    if width == 10:
+        return _BARS[filled]
+    return _sized_bar(filled, width)
+
+
+@lru_cache(maxsize=128)
+def _sized_bar(filled: int, width: int) -> str:
     return "█" * filled + "░" * (width - filled)
 
 
@@ -93,8 +122,12 @@ def render_result(result: AggregateResult, show_patterns: bool = False) -> None:
         console.print(ptable)
 
 
-def render_comparison_table(results: list[AggregateResult]) -> None:
+def render_comparison_table(results: list[AggregateResult], plain: bool = False) -> None:
     """Render a ranked comparison table for multiple URLs."""
+    if plain:
+        _echo_plain_comparison(results)
+        return
+
     console.print()
     table = Table(show_header=True, header_style="bold dim", padding=(0, 1))
     table.add_column("#", width=3, justify="right")
@@ -104,21 +137,48 @@ def render_comparison_table(results: list[AggregateResult]) -> None:
     table.add_column("Source")
 
     for i, result in enumerate(results, 1):
-        label_style = _LABEL_COLORS.get(result.label, "white")
-        source = result.url or result.file_path or "unknown"
-        # Truncate long URLs
-        if len(source) > 60:
-            source = source[:57] + "..."
+        label_style = _LABEL_STYLES.get(result.label, _DEFAULT_LABEL_STYLE)
         table.add_row(
             str(i),
             Text(str(result.aggregate_score), style=label_style),
             Text(result.label, style=label_style),
             f"{result.word_count:,}",
-            source,
+            _truncate_source(result),
         )
 
     console.print(table)
 
 
+def _truncate_source(result: AggregateResult) -> str:
+    source = result.url or result.file_path or "unknown"
+    # Truncate long URLs
+    if len(source) > 60:
+        source = source[:57] + "..."
+    return source
+
+
+def _echo_plain_comparison(results: list[AggregateResult]) -> None:
+    """
+    Fixed-width comparison table built by string padding — no Rich layout pass.
+
+    Colors the score and label with precomputed escapes only when stdout is a
+    terminal, so piped output (logs, CI) stays clean text.
+    """
+    color = console.is_terminal and not console.no_color
+    lines = [f"{'#':>3}  {'Score':>7}  {'Label':<14}  {'Words':>8}  Source"]
+    for i, result in enumerate(results, 1):
+        score = str(result.aggregate_score).rjust(7)
+        label = result.label.ljust(14)
+        if color:
+            start = _LABEL_ANSI.get(result.label, "")
+            end = _ANSI_RESET if start else ""
+            score = f"{start}{score}{end}"
+            label = f"{start}{label}{end}"
+        lines.append(
+            f"{i:>3}  {score}  {label}  {result.word_count:>8,}  {_truncate_source(result)}"
+        )
+    click.echo("\n".join(lines))
+
+
 def render_error(message: str) -> None:
     console.print(f"[bold red]Error:[/bold red] {message}")
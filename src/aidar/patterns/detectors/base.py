@@ -1,10 +1,100 @@
 from __future__ import annotations
 
+import re
 from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import Iterator
+from functools import cached_property
 
 from aidar.models.pattern import PatternDef
 from aidar.models.result import PatternResult
 
+# Simple sentence splitter — handles ., !, ? followed by whitespace + capital.
+# Matches the terminator itself rather than looking behind for it, so the
+# engine only tries a match at .!? instead of at every whitespace run.
+_SENTENCE_END_RE = re.compile(r'[.!?]\s+(?=[A-Z"])')
+_WORD_RE = re.compile(r"\w+")
+
+
+def _split_sentences(text: str) -> tuple[list[str], list[int]]:
+    """
+    Naive sentence splitter sufficient for pattern analysis.
+
+    Returns the sentences and, in a parallel list, each one's word count —
+    already computed for the two-word minimum, so callers never re-split.
+    """
+    text = text.strip()
+    sentences: list[str] = []
+    lengths: list[int] = []
+    for sentence in _sentence_spans(text):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        n = len(sentence.split())
+        if n >= 2:
+            sentences.append(sentence)
+            lengths.append(n)
+    return sentences, lengths
+
+
+def _sentence_spans(text: str) -> Iterator[str]:
+    """Pieces of `text` between sentence breaks, terminators kept."""
+    start = 0
+    for m in _SENTENCE_END_RE.finditer(text):
+        yield text[start:m.start() + 1]
+        start = m.end()
+    yield text[start:]
+
+
+class ScanContext:
+    """
+    Per-document preprocessing shared by every detector in one Analyzer.run.
+
+    Each view is computed on first use and then reused, so the text is
+    lowered, tokenized and sentence-split once per document rather than once
+    per detector that needs it.
+    """
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self._ngram_counts: dict[int, Counter[tuple[str, ...]]] = {}
+
+    @cached_property
+    def text_lower(self) -> str:
+        return self.text.lower()
+
+    @cached_property
+    def tokens(self) -> list[str]:
+        """_WORD_RE tokens of the lowered text."""
+        return _WORD_RE.findall(self.text_lower)
+
+    @cached_property
+    def token_counts(self) -> Counter[str]:
+        """Occurrences of each entry in `tokens`."""
+        return Counter(self.tokens)
+
+    def ngram_counts(self, n: int) -> Counter[tuple[str, ...]]:
+        """Occurrences of each run of `n` consecutive tokens (n >= 2)."""
+        counts = self._ngram_counts.get(n)
+        if counts is None:
+            tokens = self.tokens
+            counts = Counter(tuple(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+            self._ngram_counts[n] = counts
+        return counts
+
+    @cached_property
+    def _sentence_split(self) -> tuple[list[str], list[int]]:
+        return _split_sentences(self.text)
+
+    @property
+    def sentences(self) -> list[str]:
+        return self._sentence_split[0]
+
+    @property
+    def sentence_lengths(self) -> list[int]:
+        """Word count of each entry in `sentences`."""
+        return self._sentence_split[1]
+
 
 class BaseDetector(ABC):
     """All pattern detectors implement this interface."""
@@ -14,11 +104,19 @@ class BaseDetector(ABC):
         self.pattern_hash = pattern.fingerprint()
 
     @abstractmethod
-    def detect(self, text: str, word_count: int, raw_html: str | None = None) -> PatternResult:
+    def detect(
+        self,
+        text: str,
+        word_count: int,
+        raw_html: str | None = None,
+        ctx: ScanContext | None = None,
+    ) -> PatternResult:
         """
         Run detection against `text`.
         `word_count` is pre-computed to avoid re-counting per detector.
         `raw_html` is the original HTML source, available for HTML-level detectors.
+        `ctx` carries shared preprocessing of `text`; detectors that need it
+        build their own when called without one.
         Returns a PatternResult with raw_value and normalized_score filled.
         """
         ...
@@ -1,8 +1,34 @@
 from __future__ import annotations
 
+from collections import Counter
+
 from aidar.models.pattern import PatternDef
 from aidar.models.result import PatternResult
-from aidar.patterns.detectors.base import BaseDetector
+from aidar.patterns.detectors.base import _WORD_RE, BaseDetector, ScanContext
+
+try:
+    import ahocorasick
+    _AHOCORASICK_AVAILABLE = True
+except ImportError:
+    _AHOCORASICK_AVAILABLE = False
+
+
+def _build_automaton(terms: list[str]) -> ahocorasick.Automaton | None:
+    """
+    One Aho-Corasick automaton over all of a detector's terms.
+
+    Each key maps to (term index, length, multiplicity) — duplicate terms in
+    the YAML collapse to one key but still count once per copy, as the
+    per-term loop did. Returns None when pyahocorasick is not installed or
+    a term is empty (str.count("") has no automaton equivalent).
+    """
+    if not _AHOCORASICK_AVAILABLE or not terms or "" in terms:
+        return None
+    automaton = ahocorasick.Automaton()
+    for idx, (term, copies) in enumerate(Counter(terms).items()):
+        automaton.add_word(term, (idx, len(term), copies))
+    automaton.make_automaton()
+    return automaton
 
 
 class FrequencyDetector(BaseDetector):
@@ -12,22 +38,62 @@ class FrequencyDetector(BaseDetector):
         super().__init__(pattern)
         self._terms: list[str] = [t.lower() for t in pattern.params.get("terms", [])]
         self._match_mode: str = pattern.params.get("match_mode", "contains")
+        self._automaton: ahocorasick.Automaton | None = None
+        # exact mode: single-word terms, and multi-word terms as word tuples by length
+        self._exact_words: list[str] = []
+        self._exact_phrases: dict[int, list[tuple[str, ...]]] = {}
+        if self._match_mode == "exact":
+            for term in self._terms:
+                words = tuple(_WORD_RE.findall(term))
+                if len(words) == 1:
+                    self._exact_words.append(words[0])
+                elif words:
+                    self._exact_phrases.setdefault(len(words), []).append(words)
+        else:
+            self._automaton = _build_automaton(self._terms)
 
-    def detect(self, text: str, word_count: int, raw_html: str | None = None) -> PatternResult:
-        per_n = int(self.pattern.params.get("per_n_words", 1000))
-        text_lower = text.lower()
+    def _count_exact(self, ctx: ScanContext) -> int:
+        # Every term is a lookup in the context's shared token/n-gram counts.
+        # Word boundaries come from the tokenizer, so "thus," and a final
+        # "thus" both count.
+        token_counts = ctx.token_counts
+        total = sum(token_counts[w] for w in self._exact_words)
+        for n, phrases in self._exact_phrases.items():
+            ngram_counts = ctx.ngram_counts(n)
+            total += sum(ngram_counts[p] for p in phrases)
+        return total
+
+    def _count_contains(self, text_lower: str) -> int:
+        if self._automaton is None:
+            return sum(text_lower.count(term) for term in self._terms)
+        # Single pass for every term. The automaton reports overlapping hits;
+        # keeping only those that start past the term's previous counted hit
+        # reproduces str.count's non-overlapping, left-to-right tally.
         total = 0
+        last_end: dict[int, int] = {}
+        for end, (idx, length, copies) in self._automaton.iter(text_lower):
+            if end - length >= last_end.get(idx, -1):
+                last_end[idx] = end
+                total += copies
+        return total
+
+    def detect(
+        self,
+        text: str,
+        word_count: int,
+        raw_html: str | None = None,
+        ctx: ScanContext | None = None,
+    ) -> PatternResult:
+        per_n = int(self.pattern.params.get("per_n_words", 1000))
+        if ctx is None:
+            ctx = ScanContext(text)
 
-        for term in self._terms:
-            if self._match_mode == "exact":
-                # Match whole words only
-                count = text_lower.count(f" {term} ") + (
-                    1 if text_lower.startswith(term + " ") else 0
-                )
-            else:
-                # contains — substring match
-                count = text_lower.count(term)
-            total += count
+        if self._match_mode == "exact":
+            # Match whole words only
+            total = self._count_exact(ctx)
+        else:
+            # contains — substring match
+            total = self._count_contains(ctx.text_lower)
 
         raw = (total / max(word_count, 1)) * per_n
         return self._make_result(raw, f"{raw:.2f} per {per_n} words ({total} matches)")
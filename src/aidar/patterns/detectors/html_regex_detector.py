@@ -4,7 +4,7 @@ import re
 
 from aidar.models.pattern import PatternDef
 from aidar.models.result import PatternResult
-from aidar.patterns.detectors.base import BaseDetector
+from aidar.patterns.detectors.base import BaseDetector, ScanContext
 
 
 class HTMLRegexDetector(BaseDetector):
@@ -30,7 +30,13 @@ class HTMLRegexDetector(BaseDetector):
             for p in fallback_patterns
         ]
 
-    def detect(self, text: str, word_count: int, raw_html: str | None = None) -> PatternResult:
+    def detect(
+        self,
+        text: str,
+        word_count: int,
+        raw_html: str | None = None,
+        ctx: ScanContext | None = None,
+    ) -> PatternResult:
         per_n = int(self.pattern.params.get("per_n_words", 1000))
 
         if raw_html is not None:
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import re
-import statistics
 
 from aidar.models.pattern import PatternDef
 from aidar.models.result import PatternResult
-from aidar.patterns.detectors.base import BaseDetector
+from aidar.patterns.detectors import stats
+from aidar.patterns.detectors.base import BaseDetector, ScanContext
 
 try:
     from wordfreq import zipf_frequency
@@ -13,70 +13,92 @@ try:
 except ImportError:
     _WORDFREQ_AVAILABLE = False
 
-_CONTENT_WORD_RE = re.compile(r'\b[a-z]{4,}\b')
-
-# Simple sentence splitter — handles ., !, ? followed by whitespace + capital
-_SENTENCE_RE = re.compile(r'(?<=[.!?])\s+(?=[A-Z"])')
 # Question detection
 _QUESTION_RE = re.compile(r'\?')
 # Sentence-ending question
 _QUESTION_SENTENCE_RE = re.compile(r'[^.!?]*\?')
 
 
-def _split_sentences(text: str) -> list[str]:
-    """Naive sentence splitter sufficient for pattern analysis."""
-    sentences = _SENTENCE_RE.split(text.strip())
-    return [s.strip() for s in sentences if s.strip() and len(s.split()) >= 2]
+# word → Zipf frequency. zipf_frequency redoes its argument handling, cache
+# lookup and log/rounding per call; vocabulary repeats heavily within and
+# across documents, so a plain dict lookup serves nearly every word.
+# Cleared when full, the same bound wordfreq applies to its own cache.
+_ZIPF_CACHE: dict[str, float] = {}
+_ZIPF_CACHE_SIZE = 100_000
+
+
+def _zipf_frequencies(words: list[str]) -> list[float]:
+    cache = _ZIPF_CACHE
+    freqs = []
+    for w in words:
+        f = cache.get(w)
+        if f is None:
+            if len(cache) >= _ZIPF_CACHE_SIZE:
+                cache.clear()
+            f = cache[w] = zipf_frequency(w, "en")
+        freqs.append(f)
+    return freqs
+
+
+def warm_wordfreq() -> None:
+    """Load wordfreq's English frequency table so the first scan doesn't pay for it."""
+    if _WORDFREQ_AVAILABLE:
+        zipf_frequency("the", "en")
 
 
 class LinguisticDetector(BaseDetector):
     """Analyzes linguistic properties: sentence burstiness, TTR, question rate, etc."""
 
-    def detect(self, text: str, word_count: int, raw_html: str | None = None) -> PatternResult:
+    def detect(
+        self,
+        text: str,
+        word_count: int,
+        raw_html: str | None = None,
+        ctx: ScanContext | None = None,
+    ) -> PatternResult:
         metric = self.pattern.params["metric"]
+        if ctx is None:
+            ctx = ScanContext(text)
 
         if metric == "sentence_burstiness":
-            return self._sentence_burstiness(text)
+            return self._sentence_burstiness(ctx)
         elif metric == "type_token_ratio":
-            return self._type_token_ratio(text, word_count)
+            return self._type_token_ratio(ctx, word_count)
         elif metric == "question_rate":
-            return self._question_rate(text)
+            return self._question_rate(ctx)
         elif metric == "avg_sentence_length":
-            return self._avg_sentence_length(text)
+            return self._avg_sentence_length(ctx)
         elif metric == "word_freq_variance":
-            return self._word_freq_variance(text)
+            return self._word_freq_variance(ctx)
         else:
             raise ValueError(f"Unknown linguistic metric: {metric}")
 
-    def _sentence_burstiness(self, text: str) -> PatternResult:
+    def _sentence_burstiness(self, ctx: ScanContext) -> PatternResult:
         """
         Coefficient of variation of sentence word counts.
         Low CV = uniform sentence lengths = AI-like.
         Score is INVERTED: low burstiness → high score.
         """
-        sentences = _split_sentences(text)
-        if len(sentences) < 4:
+        if len(ctx.sentences) < 4:
             return self._make_result(0.0, "too few sentences")
 
-        lengths = [len(s.split()) for s in sentences]
-        mean = statistics.mean(lengths)
+        mean, stdev = stats.mean_stdev(ctx.sentence_lengths)
         if mean == 0:
             return self._make_result(0.0, "empty sentences")
 
-        stdev = statistics.stdev(lengths)
         cv = stdev / mean  # coefficient of variation
 
         # Invert: low CV (uniform) → high AI score
         inverted = max(0.0, 1.0 - cv)
         return self._make_result(inverted, f"CV={cv:.2f} (burstiness={1-inverted:.2f})")
 
-    def _type_token_ratio(self, text: str, word_count: int) -> PatternResult:
+    def _type_token_ratio(self, ctx: ScanContext, word_count: int) -> PatternResult:
         """
         Unique words / total words. Low TTR = repetitive = AI-like.
         Uses a sliding window (STTR) to control for text length.
         Score is INVERTED: low TTR → high score.
         """
-        words = [w.lower().strip(".,!?;:\"'()[]") for w in text.split() if w.strip()]
+        words = [w.strip(".,!?;:\"'()[]") for w in ctx.text_lower.split()]
         if len(words) < 50:
             return self._make_result(0.0, "too few words for TTR")
 
@@ -87,13 +109,13 @@ class LinguisticDetector(BaseDetector):
             chunk = words[i:i + window]
             ttrs.append(len(set(chunk)) / len(chunk))
 
-        avg_ttr = statistics.mean(ttrs) if ttrs else len(set(words)) / len(words)
+        avg_ttr = stats.mean(ttrs) if ttrs else len(set(words)) / len(words)
 
         # Invert: low TTR (repetitive) → high score
         inverted = max(0.0, 1.0 - avg_ttr)
         return self._make_result(inverted, f"STTR={avg_ttr:.3f}")
 
-    def _question_rate(self, text: str) -> PatternResult:
+    def _question_rate(self, ctx: ScanContext) -> PatternResult:
         """
         Fraction of sentences ending with '?'. Near-zero in AI text.
         Score is INVERTED: low question rate → high AI score.
@@ -102,7 +124,7 @@ class LinguisticDetector(BaseDetector):
         human technical/tutorial writing — reserve the full 1.0 for when other
         signals also fire. Weight is intentionally low (0.20).
         """
-        sentences = _split_sentences(text)
+        sentences = ctx.sentences
         if not sentences:
             return self._make_result(0.0, "no sentences")
 
@@ -119,18 +141,17 @@ class LinguisticDetector(BaseDetector):
 
         return self._make_result(inverted, f"{questions}/{len(sentences)} sentences are questions ({rate:.1%})")
 
-    def _avg_sentence_length(self, text: str) -> PatternResult:
+    def _avg_sentence_length(self, ctx: ScanContext) -> PatternResult:
         """
         Average sentence length in words. AI tends toward 18-25 word sentences.
         Very short or very long averages suggest human writing.
         """
-        sentences = _split_sentences(text)
-        if not sentences:
+        if not ctx.sentences:
             return self._make_result(0.0, "no sentences")
-        avg = statistics.mean(len(s.split()) for s in sentences)
+        avg = stats.mean(ctx.sentence_lengths)
         return self._make_result(avg, f"{avg:.1f} words/sentence avg")
 
-    def _word_freq_variance(self, text: str) -> PatternResult:
+    def _word_freq_variance(self, ctx: ScanContext) -> PatternResult:
         """
         Vocabulary predictability via word frequency standard deviation.
         Uses Zipf frequency scores (wordfreq library) for each content word.
@@ -155,7 +176,10 @@ class LinguisticDetector(BaseDetector):
                 pattern_hash=self.pattern_hash,
             )
 
-        words = _CONTENT_WORD_RE.findall(text.lower())
+        # Content words: \w-runs that are 4+ ASCII lowercase letters — what
+        # \b[a-z]{4,}\b matches, read off the shared ctx.tokens (\w+ over
+        # the lowered text) instead of another regex pass
+        words = [w for w in ctx.tokens if len(w) >= 4 and w.isascii() and w.isalpha()]
         if len(words) < 30:
             return PatternResult(
                 pattern_id=self.pattern.id,
@@ -168,9 +192,8 @@ class LinguisticDetector(BaseDetector):
                 pattern_hash=self.pattern_hash,
             )
 
-        freqs = [zipf_frequency(w, "en") for w in words]
         # Only include words known to the frequency list (zipf > 0)
-        freqs = [f for f in freqs if f > 0]
+        freqs = [f for f in _zipf_frequencies(words) if f > 0]
         if len(freqs) < 20:
             return PatternResult(
                 pattern_id=self.pattern.id,
@@ -183,7 +206,7 @@ class LinguisticDetector(BaseDetector):
                 pattern_hash=self.pattern_hash,
             )
 
-        std = statistics.stdev(freqs)
+        _, std = stats.mean_stdev(freqs)
 
         # Invert: low std (narrow vocabulary) → high score (AI-like)
         # threshold_low = std below which score saturates at 1.0 (very predictable)
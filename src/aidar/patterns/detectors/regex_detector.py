@@ -1,10 +1,59 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Callable
 
 from aidar.models.pattern import PatternDef
 from aidar.models.result import PatternResult
-from aidar.patterns.detectors.base import BaseDetector
+from aidar.patterns.detectors.base import BaseDetector, ScanContext
+
+try:
+    import hyperscan
+    _HYPERSCAN_AVAILABLE = True
+except ImportError:
+    _HYPERSCAN_AVAILABLE = False
+
+
+def _build_prefilter(sources: list[str]) -> Callable[[str], set[int]] | None:
+    """
+    Compile all of a detector's regexes into one Hyperscan database.
+
+    The database runs in prefilter mode (lookarounds are approximated, never
+    dropped) with one report per expression, so a single pass over the text
+    returns the indices of every regex that *might* match. Regexes it rules out
+    count zero without a Python `re` scan. Returns None when Hyperscan is not
+    installed or rejects any expression, leaving plain per-regex scanning.
+    """
+    if not _HYPERSCAN_AVAILABLE or not sources:
+        return None
+    flags = (
+        hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+        | hyperscan.HS_FLAG_PREFILTER | hyperscan.HS_FLAG_SINGLEMATCH
+    )
+    db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    try:
+        db.compile(
+            expressions=[s.encode("utf-8") for s in sources],
+            ids=list(range(len(sources))),
+            elements=len(sources),
+            flags=[flags] * len(sources),
+        )
+    except hyperscan.error:
+        return None
+
+    def candidates(text: str) -> set[int]:
+        hits: set[int] = set()
+        db.scan(
+            text.encode("utf-8", errors="surrogatepass"),
+            match_event_handler=lambda idx, start, end, flags, ctx: hits.add(idx),
+        )
+        return hits
+
+    return candidates
+
+
+def _is_caseless_literal(p: str) -> bool:
+    return len(p) <= 3 and p.lower() == p == p.upper() and not any(ch.isalpha() for ch in p)
 
 
 class RegexDetector(BaseDetector):
@@ -13,13 +62,30 @@ class RegexDetector(BaseDetector):
     def __init__(self, pattern: PatternDef) -> None:
         super().__init__(pattern)
         raw_patterns = pattern.params.get("patterns", [])
-        self._compiled = [
-            re.compile(re.escape(p) if len(p) <= 3 else p, re.IGNORECASE | re.UNICODE)
+        # Short patterns are literals. Without letters, IGNORECASE has nothing to
+        # fold, so str.count gives findall's non-overlapping count in one C scan.
+        self._literals = [p for p in raw_patterns if _is_caseless_literal(p)]
+        sources = [
+            re.escape(p) if len(p) <= 3 else p
             for p in raw_patterns
+            if not _is_caseless_literal(p)
         ]
+        self._compiled = [re.compile(s, re.IGNORECASE | re.UNICODE) for s in sources]
+        self._prefilter = _build_prefilter(sources) if len(sources) > 1 else None
 
-    def detect(self, text: str, word_count: int, raw_html: str | None = None) -> PatternResult:
+    def detect(
+        self,
+        text: str,
+        word_count: int,
+        raw_html: str | None = None,
+        ctx: ScanContext | None = None,
+    ) -> PatternResult:
         per_n = int(self.pattern.params.get("per_n_words", 1000))
-        total_matches = sum(len(r.findall(text)) for r in self._compiled)
+        total_matches = sum(text.count(lit) for lit in self._literals)
+        if self._prefilter is not None:
+            hits = self._prefilter(text)
+            total_matches += sum(len(self._compiled[i].findall(text)) for i in hits)
+        else:
+            total_matches += sum(len(r.findall(text)) for r in self._compiled)
         raw = (total_matches / max(word_count, 1)) * per_n
         return self._make_result(raw, f"{raw:.1f} per {per_n} words")
@@ -0,0 +1,65 @@
+"""
+Single-pass mean / sample standard deviation for detector metrics.
+
+Results are bit-identical to statistics.mean / statistics.stdev — stored
+raw values don't shift — but come from one loop over the data with plain
+integer sums instead of the statistics module's per-item Fraction handling.
+Every int and finite float is an exact dyadic rational, so the sums are
+accumulated exactly over a shared power-of-two denominator and rounded once.
+"""
+from __future__ import annotations
+
+import math
+import sys
+from collections.abc import Iterable
+
+# Extra precision bits for the correctly rounded square root (as in statistics)
+_SQRT_BITS = 2 * sys.float_info.mant_dig + 3
+
+
+def _isqrt_frac_rto(n: int, m: int) -> int:
+    """floor(sqrt(n/m)) with its low bit set when inexact (round-to-odd)."""
+    a = math.isqrt(n // m)
+    return a | (a * a * m != n)
+
+
+def _sqrt_frac(n: int, m: int) -> float:
+    """sqrt(n/m) as a correctly rounded float."""
+    q = (n.bit_length() - m.bit_length() - _SQRT_BITS) // 2
+    if q >= 0:
+        return float(_isqrt_frac_rto(n, m << 2 * q) << q)
+    return _isqrt_frac_rto(n << -2 * q, m) / (1 << -q)
+
+
+def _exact_sums(xs: Iterable[float]) -> tuple[int, int, int, int]:
+    """(n, Σx·den, Σx²·den², den) with every term exact."""
+    n = total = squares = 0
+    den = 1
+    for x in xs:
+        p, q = x.as_integer_ratio()
+        if q > den:
+            k = q // den
+            total *= k
+            squares *= k * k
+            den = q
+        k = den // q
+        total += p * k
+        squares += p * p * k * k
+        n += 1
+    return n, total, squares, den
+
+
+def mean(xs: Iterable[float]) -> float:
+    """statistics.mean for ints/floats. Needs at least one value."""
+    n, total, _, den = _exact_sums(xs)
+    if n < 1:
+        raise ValueError("mean requires at least one data point")
+    return total / (n * den)
+
+
+def mean_stdev(xs: Iterable[float]) -> tuple[float, float]:
+    """(statistics.mean, statistics.stdev) from one pass. Needs at least two values."""
+    n, total, squares, den = _exact_sums(xs)
+    if n < 2:
+        raise ValueError("stdev requires at least two data points")
+    return total / (n * den), _sqrt_frac(n * squares - total * total, n * (n - 1) * den * den)
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import re
-import statistics
 import unicodedata
 
 from aidar.models.pattern import PatternDef
 from aidar.models.result import PatternResult
-from aidar.patterns.detectors.base import BaseDetector
+from aidar.patterns.detectors import stats
+from aidar.patterns.detectors.base import BaseDetector, ScanContext
 
 # Bullet markers: -, *, •, ·, ◦, ▪, ▸, ►, ✓, ✗, numbered list (1. 2. etc)
 _BULLET_RE = re.compile(r"^\s*(?:[-*•·◦▪▸►✓✗]|\d+[.)]\s)\s*\S", re.MULTILINE)
@@ -29,7 +29,13 @@ _EMOJI_RE = re.compile(
 class StructuralDetector(BaseDetector):
     """Analyzes document-level structural shape metrics."""
 
-    def detect(self, text: str, word_count: int, raw_html: str | None = None) -> PatternResult:
+    def detect(
+        self,
+        text: str,
+        word_count: int,
+        raw_html: str | None = None,
+        ctx: ScanContext | None = None,
+    ) -> PatternResult:
         metric = self.pattern.params["metric"]
 
         if metric == "bullet_density":
@@ -61,11 +67,9 @@ class StructuralDetector(BaseDetector):
         paragraphs = [p.strip() for p in re.split(r"\n\s*\n", text) if p.strip()]
         if len(paragraphs) < 3:
             return self._make_result(0.0, "too few paragraphs to measure")
-        lengths = [len(p.split()) for p in paragraphs]
-        mean = statistics.mean(lengths)
+        mean, stdev = stats.mean_stdev(len(p.split()) for p in paragraphs)
         if mean == 0:
             return self._make_result(0.0, "empty paragraphs")
-        stdev = statistics.stdev(lengths)
         cv = stdev / mean  # coefficient of variation
         # Invert: low CV (uniform) → high score
         inverted = 1.0 - min(cv, 1.0)
@@ -74,6 +78,8 @@ class StructuralDetector(BaseDetector):
 
     def _emoji_density(self, text: str) -> PatternResult:
         char_count = max(len(text), 1)
-        emoji_count = len(_EMOJI_RE.findall(text))
+        # isascii() reads a flag CPython already stores on the str — O(1), and every
+        # _EMOJI_RE range is non-ASCII, so pure-ASCII text skips the regex scan
+        emoji_count = 0 if text.isascii() else len(_EMOJI_RE.findall(text))
         ratio = emoji_count / char_count
         return self._make_result(ratio, f"{emoji_count} emojis ({ratio*1000:.2f} per 1000 chars)")
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+import sys
 from pathlib import Path
 
 import yaml
@@ -7,6 +9,10 @@ import yaml
 from aidar.models.config import WeightConfig
 from aidar.models.pattern import PatternDef
 
+# libyaml's C parser is ~10x faster than the pure-Python one; every CLI start
+# parses the whole patterns tree
+_SafeLoader: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class PatternLoadError(Exception):
     pass
@@ -18,15 +24,7 @@ def load_patterns(patterns_dir: Path) -> list[PatternDef]:
     _weights.yaml and models/*.yaml. Returns validated PatternDef instances.
     """
     patterns: list[PatternDef] = []
-    models_dir = patterns_dir / "models"
-
-    for yaml_file in sorted(patterns_dir.rglob("*.yaml")):
-        # Skip the weights config and model profiles
-        if yaml_file.name.startswith("_"):
-            continue
-        if yaml_file.is_relative_to(models_dir):
-            continue
-
+    for yaml_file in _pattern_files(patterns_dir):
         try:
             data = _load_yaml(yaml_file)
             pattern = _parse_pattern(data, yaml_file)
@@ -37,6 +35,25 @@ def load_patterns(patterns_dir: Path) -> list[PatternDef]:
     return patterns
 
 
+def _pattern_files(patterns_dir: Path) -> list[Path]:
+    """
+    Sorted pattern YAML paths under patterns_dir.
+
+    The top-level models/ directory is pruned before descending, so model
+    profiles are never listed; underscore-prefixed files (_weights.yaml) are
+    skipped by name.
+    """
+    files: list[Path] = []
+    for root, dirs, names in os.walk(patterns_dir):
+        if root == str(patterns_dir):
+            dirs[:] = [d for d in dirs if d != "models"]
+        files.extend(
+            Path(root, name) for name in names
+            if name.endswith(".yaml") and not name.startswith("_")
+        )
+    return sorted(files)
+
+
 def load_weight_config(patterns_dir: Path) -> WeightConfig:
     """Load patterns/_weights.yaml and return WeightConfig."""
     weights_file = patterns_dir / "_weights.yaml"
@@ -73,7 +90,7 @@ def load_model_profile(patterns_dir: Path, model_name: str) -> dict[str, float]:
 def _load_yaml(path: Path) -> dict:
     try:
         with open(path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_SafeLoader)
         if not isinstance(data, dict):
             raise PatternLoadError("YAML file must contain a mapping at the top level")
         return data
@@ -92,12 +109,13 @@ def _parse_pattern(data: dict, source: Path) -> PatternDef:
             id=str(data["id"]),
             name=str(data["name"]),
             description=str(data["description"]).strip(),
-            category=str(data["category"]),
+            # Low-cardinality keys: interned so every pattern shares one object
+            category=sys.intern(str(data["category"])),
             weight=float(data["weight"]),
-            detection_type=str(data["detection_type"]),
+            detection_type=sys.intern(str(data["detection_type"])),
             params=dict(data["params"]),
             version=int(data.get("version", 1)),
-            severity=str(data.get("severity", "medium")),
+            severity=sys.intern(str(data.get("severity", "medium"))),
             references=list(data.get("references", [])),
             added_by=str(data.get("added_by", "")),
         )
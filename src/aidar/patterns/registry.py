@@ -18,9 +18,24 @@ _DETECTOR_MAP: dict[str, type[BaseDetector]] = {
 
 
 class PatternRegistry:
-    def __init__(self, patterns: list[PatternDef]) -> None:
+    def __init__(self, patterns: list[PatternDef], precompile: bool = True) -> None:
         self._patterns: dict[str, PatternDef] = {p.id: p for p in patterns}
         self._detectors: dict[str, BaseDetector] = {}
+        self._by_category: dict[str, list[PatternDef]] | None = None
+        if precompile:
+            self.precompile()
+
+    def precompile(self) -> None:
+        """
+        Build every detector up front so regexes compile once, at startup,
+        instead of inside the first Analyzer.run call.
+        """
+        for pattern_id in self._patterns:
+            try:
+                self.get_detector(pattern_id)
+            except Exception:
+                # Left unbuilt: get_detector re-raises and Analyzer.run skips it
+                pass
 
     def get_detector(self, pattern_id: str) -> BaseDetector:
         if pattern_id not in self._detectors:
@@ -34,12 +49,15 @@ class PatternRegistry:
         return self._detectors[pattern_id]
 
     def patterns_by_category(self) -> dict[str, list[PatternDef]]:
-        result: dict[str, list[PatternDef]] = {}
-        for pattern in self._patterns.values():
-            result.setdefault(pattern.category, []).append(pattern)
-        for cat in result:
-            result[cat].sort(key=lambda p: p.weight, reverse=True)
-        return result
+        """Patterns grouped by category, heaviest first. Built on first use, then shared."""
+        if self._by_category is None:
+            result: dict[str, list[PatternDef]] = {}
+            for pattern in self._patterns.values():
+                result.setdefault(pattern.category, []).append(pattern)
+            for cat in result:
+                result[cat].sort(key=lambda p: p.weight, reverse=True)
+            self._by_category = result
+        return self._by_category
 
     def all_patterns(self) -> list[PatternDef]:
         return list(self._patterns.values())
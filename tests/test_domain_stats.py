@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from aidar.db.database import get_connection, rebuild_domain_stats
+from aidar.db.queries import bulk_store_results, delete_domain, get_domain_stats, store_result
+from aidar.models.result import AggregateResult, ScoreVector
+
+DOMAINS = ("a.example", "b.example", "c.example")
+
+
+def _result(url: str, score: int, label: str, day: int) -> AggregateResult:
+    return AggregateResult(
+        url=url,
+        file_path=None,
+        word_count=300,
+        score_vector=ScoreVector(),
+        aggregate_score=score,
+        label=label,
+        scanned_at=datetime(2026, 1, day),
+    )
+
+
+@pytest.fixture
+def conn(tmp_path: Path) -> Iterator[sqlite3.Connection]:
+    conn = get_connection(tmp_path / "aidar.db")
+    yield conn
+    conn.close()
+
+
+def _snapshot(conn: sqlite3.Connection) -> tuple[list[Any], dict[str, dict[str, Any]]]:
+    rows = conn.execute("SELECT * FROM domain_stats ORDER BY domain").fetchall()
+    return rows, {d: get_domain_stats(conn, d) for d in DOMAINS}
+
+
+def _assert_matches_rebuild(conn: sqlite3.Connection) -> None:
+    before = _snapshot(conn)
+    rebuild_domain_stats(conn)
+    assert _snapshot(conn) == before
+
+
+def test_inserts_match_rebuild(conn: sqlite3.Connection) -> None:
+    bulk_store_results(conn, [
+        _result("https://a.example/1", 10, "LIKELY HUMAN", 1),
+        _result("https://a.example/2", 40, "LIKELY AI", 2),
+        _result("https://b.example/1", 20, "UNCERTAIN", 3),
+    ])
+    store_result(conn, _result("https://a.example/3", 25, "UNCERTAIN", 4))
+    conn.commit()
+
+    assert get_domain_stats(conn, "a.example")["scans"] == 3
+    _assert_matches_rebuild(conn)
+
+
+def test_rescan_upsert_matches_rebuild(conn: sqlite3.Connection) -> None:
+    bulk_store_results(conn, [
+        _result("https://a.example/1", 10, "LIKELY HUMAN", 1),
+        _result("https://a.example/2", 40, "LIKELY AI", 2),
+    ])
+    # Same URL again: ON CONFLICT DO UPDATE fires the update trigger
+    bulk_store_results(conn, [_result("https://a.example/2", 12, "LIKELY HUMAN", 5)])
+    store_result(conn, _result("https://a.example/1", 33, "UNCERTAIN", 6))
+    conn.commit()
+
+    stats = get_domain_stats(conn, "a.example")
+    assert stats["scans"] == 2
+    assert (stats["min_score"], stats["max_score"]) == (12, 33)
+    _assert_matches_rebuild(conn)
+
+
+def test_update_moving_domain_matches_rebuild(conn: sqlite3.Connection) -> None:
+    bulk_store_results(conn, [
+        _result("https://a.example/1", 10, "LIKELY HUMAN", 1),
+        _result("https://b.example/1", 20, "UNCERTAIN", 2),
+    ])
+    with conn:
+        conn.execute("UPDATE scans SET domain = 'c.example' WHERE url = 'https://a.example/1'")
+        conn.execute("UPDATE scans SET score = NULL, label = NULL WHERE domain = 'b.example'")
+
+    assert get_domain_stats(conn, "a.example")["scans"] == 0
+    assert get_domain_stats(conn, "c.example")["scans"] == 1
+    _assert_matches_rebuild(conn)
+
+
+def test_deletes_match_rebuild(conn: sqlite3.Connection) -> None:
+    bulk_store_results(conn, [
+        _result("https://a.example/1", 10, "LIKELY HUMAN", 1),
+        _result("https://a.example/2", 40, "LIKELY AI", 2),
+        _result("https://a.example/3", 25, "UNCERTAIN", 3),
+        _result("https://b.example/1", 20, "UNCERTAIN", 4),
+    ])
+    # Deleting the max-score and latest row must re-read both extremes
+    with conn:
+        conn.execute("DELETE FROM scans WHERE url IN ('https://a.example/2', 'https://a.example/3')")
+    stats = get_domain_stats(conn, "a.example")
+    assert (stats["scans"], stats["max_score"]) == (1, 10)
+    _assert_matches_rebuild(conn)
+
+    delete_domain(conn, "b.example")
+    assert get_domain_stats(conn, "b.example") == {"domain": "b.example", "scans": 0}
+    _assert_matches_rebuild(conn)
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from aidar.core.limiter import _RECOVER_AFTER, DomainLimiter
+
+URL = "https://example.com/post"
+
+
+def _rate(limiter: DomainLimiter, host: str = "example.com") -> float:
+    return limiter._bucket(host).rate
+
+
+def _streak(limiter: DomainLimiter) -> int:
+    return limiter._bucket("example.com").ok_streak
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_throttle_status_halves_rate(status: int) -> None:
+    limiter = DomainLimiter(8.0, burst=4)
+    limiter.record(URL, status)
+    assert _rate(limiter) == 4.0
+    limiter.record(URL, status)
+    assert _rate(limiter) == 2.0
+
+
+def test_throttle_never_goes_below_min_rate() -> None:
+    limiter = DomainLimiter(1.0, min_rate=0.4)
+    for _ in range(5):
+        limiter.record(URL, 429)
+    assert _rate(limiter) == 0.4
+
+
+def test_successes_raise_throttled_rate_by_a_quarter() -> None:
+    limiter = DomainLimiter(8.0)
+    limiter.record(URL, 429)
+    for _ in range(_RECOVER_AFTER - 1):
+        limiter.record(URL, 200)
+    assert _rate(limiter) == 4.0
+    limiter.record(URL, 301)
+    assert _rate(limiter) == 5.0
+    assert _streak(limiter) == 0
+
+
+def test_recovery_is_capped_at_starting_rate() -> None:
+    limiter = DomainLimiter(8.0)
+    limiter.record(URL, 429)
+    for _ in range(_RECOVER_AFTER * 10):
+        limiter.record(URL, 200)
+    assert _rate(limiter) == 8.0
+
+
+def test_client_errors_are_neutral() -> None:
+    limiter = DomainLimiter(8.0)
+    limiter.record(URL, 200)
+    limiter.record(URL, 404)
+    limiter.record(URL, 410)
+    assert _streak(limiter) == 1
+    assert _rate(limiter) == 8.0
+
+
+@pytest.mark.parametrize("status", [None, 500, 502])
+def test_server_and_network_errors_break_the_streak(status: int | None) -> None:
+    limiter = DomainLimiter(8.0)
+    limiter.record(URL, 429)
+    for _ in range(_RECOVER_AFTER - 1):
+        limiter.record(URL, 200)
+    limiter.record(URL, status)
+    assert _streak(limiter) == 0
+    assert _rate(limiter) == 4.0
+    limiter.record(URL, 200)
+    assert _rate(limiter) == 4.0
+
+
+def test_hosts_are_throttled_independently() -> None:
+    limiter = DomainLimiter(8.0)
+    limiter.record(URL, 429)
+    assert _rate(limiter) == 4.0
+    assert _rate(limiter, "other.org") == 8.0
+
+
+def test_acquire_spends_burst_without_waiting() -> None:
+    limiter = DomainLimiter(0.001, burst=3)
+
+    async def take(n: int) -> None:
+        for _ in range(n):
+            await asyncio.wait_for(limiter.acquire(URL), timeout=1)
+
+    asyncio.run(take(3))
+    assert limiter._bucket("example.com").tokens < 1
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from aidar.db.pool import ReaderPool, WriterConn
+
+INSERT = "INSERT INTO scans (url, domain, score) VALUES (?, 'example.com', 10)"
+
+
+@pytest.fixture
+def pools(tmp_path: Path) -> Iterator[tuple[WriterConn, ReaderPool]]:
+    db_path = tmp_path / "aidar.db"
+    writer = WriterConn(db_path)
+    readers = ReaderPool(db_path, size=2)
+    yield writer, readers
+    readers.close()
+    writer.close()
+
+
+def _count(readers: ReaderPool) -> int:
+    with readers.connection() as conn:
+        return int(conn.execute("SELECT COUNT(*) FROM scans").fetchone()[0])
+
+
+def test_reader_sees_committed_writes(pools: tuple[WriterConn, ReaderPool]) -> None:
+    writer, readers = pools
+    assert _count(readers) == 0
+
+    with writer.connection() as conn:
+        conn.execute(INSERT, ("https://example.com/1",))
+        assert _count(readers) == 0  # not committed yet
+        conn.commit()
+    assert _count(readers) == 1
+
+    # The now-idle reader is reused and must not be stuck on an old snapshot
+    with writer.connection() as conn:
+        conn.execute(INSERT, ("https://example.com/2",))
+        conn.commit()
+    assert _count(readers) == 2
+
+
+def test_reader_sees_writes_from_another_thread(pools: tuple[WriterConn, ReaderPool]) -> None:
+    writer, readers = pools
+
+    def write() -> None:
+        with writer.connection() as conn:
+            conn.execute(INSERT, ("https://example.com/1",))
+            conn.commit()
+
+    t = threading.Thread(target=write)
+    t.start()
+    t.join()
+    assert _count(readers) == 1
+
+
+@pytest.mark.parametrize("sql", [
+    "INSERT INTO scans (url, domain) VALUES ('https://example.com/x', 'example.com')",
+    "DELETE FROM scans",
+    "CREATE TABLE t (x INTEGER)",
+])
+def test_reader_connections_reject_writes(pools: tuple[WriterConn, ReaderPool], sql: str) -> None:
+    _, readers = pools
+    with readers.connection() as conn:
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            conn.execute(sql)
+
+
+def test_pool_reuses_connections_up_to_size(pools: tuple[WriterConn, ReaderPool]) -> None:
+    _, readers = pools
+    with readers.connection() as a, readers.connection() as b:
+        assert a is not b
+    with readers.connection() as c:
+        assert c in (a, b)
+    assert readers._opened == 2
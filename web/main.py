@@ -1,22 +1,40 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import io
 import json
+import multiprocessing
 import os
+import re
+import sqlite3
+import tempfile
+import threading
 import time
+from bisect import bisect_right
+from collections.abc import AsyncIterator, Callable, Hashable
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import AbstractContextManager, asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, overload
 
 import httpx
+import jinja2
 from fastapi import BackgroundTasks, FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse, Response, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
-from aidar.db.database import get_connection
+from aidar import __version__
+from aidar.db.pool import ReaderPool, WriterConn
 from aidar.db.queries import (
     delete_domain,
     get_corpus_percentile,
+    get_domain_averages,
     get_domain_extremes,
     get_domain_leaderboard,
     get_domain_scans,
@@ -26,53 +44,268 @@ from aidar.db.queries import (
     get_pattern_stats,
 )
 
+if TYPE_CHECKING:
+    from PIL import ImageFont
+
+    from aidar.core.analyzer import Analyzer
+    from aidar.models.config import AppConfig
+    from aidar.models.result import AggregateResult
+
+try:
+    import orjson
+
+    def _loads(blob: str | bytes) -> Any:
+        return orjson.loads(blob)
+
+    def _json_response(payload: Any) -> Response:
+        """/api payloads are plain dicts/lists: skip jsonable_encoder and the
+        stdlib encoder, orjson emits the UTF-8 body directly."""
+        return Response(orjson.dumps(payload), media_type="application/json")
+except ImportError:
+    def _loads(blob: str | bytes) -> Any:
+        return json.loads(blob)
+
+    def _json_response(payload: Any) -> Response:
+        return JSONResponse(payload)
+
 DB_PATH = os.environ.get("AIDAR_DB", "aidar.db")
 ADMIN_KEY = os.environ.get("AIDAR_ADMIN_KEY", "")
 
-app = FastAPI(title="aidar.lol", docs_url=None, redoc_url=None)
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+    if _scan_pool is not None:
+        # shutdown() joins the workers: keep that wait off the event loop
+        await run_in_threadpool(_scan_pool.shutdown, cancel_futures=True)
+
+
+app = FastAPI(title="aidar.lol", docs_url=None, redoc_url=None, lifespan=_lifespan)
+# Leaderboard/domain HTML and /api JSON compress several-fold; small
+# responses (badges, status polls) aren't worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 BASE_DIR = Path(__file__).parent
 app.mount("/static", StaticFiles(directory=BASE_DIR / "static"), name="static")
-templates = Jinja2Templates(directory=BASE_DIR / "templates")
+
+
+def _template_env() -> jinja2.Environment:
+    """
+    Jinja environment with compiled templates cached on disk, so a fresh
+    worker or dyno skips parse+compile. AIDAR_TEMPLATE_RELOAD=0 also skips
+    the per-render stat() of template files (set by scripts/start.sh).
+    """
+    cache_dir = Path(tempfile.gettempdir()) / "aidar-jinja"
+    try:
+        cache_dir.mkdir(exist_ok=True)
+        bytecode_cache = jinja2.FileSystemBytecodeCache(str(cache_dir))
+    except OSError:
+        bytecode_cache = None
+    return jinja2.Environment(
+        loader=jinja2.FileSystemLoader(BASE_DIR / "templates"),
+        autoescape=True,
+        bytecode_cache=bytecode_cache,
+        auto_reload=os.environ.get("AIDAR_TEMPLATE_RELOAD", "1") != "0",
+    )
+
+
+templates = Jinja2Templates(env=_template_env())
+
+RATE_LIMIT_SECONDS = 60 * 60 * 6  # 6 hours between web-triggered rescans
+
+
+_V = TypeVar("_V")
+_T = TypeVar("_T")
+
+
+class _ExpiringDict(Generic[_V]):
+    """
+    Bounded str-keyed map whose entries expire ttl seconds after they were
+    last set; when full, the least recently set entry is evicted. Written
+    from the event loop and read from threadpool handlers, so every access
+    holds a lock.
+    """
+
+    def __init__(self, ttl: float, maxsize: int) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: dict[str, tuple[float, _V]] = {}
+        self._lock = threading.Lock()
+
+    @overload
+    def get(self, key: str) -> _V | None: ...
+    @overload
+    def get(self, key: str, default: _V) -> _V: ...
+
+    def get(self, key: str, default: _V | None = None) -> _V | None:
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is None:
+                return default
+            if hit[0] <= time.monotonic():
+                del self._data[key]
+                return default
+            return hit[1]
+
+    def __setitem__(self, key: str, value: _V) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+            if len(self._data) >= self.maxsize:
+                del self._data[next(iter(self._data))]
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
 
 # In-memory scan status (per-dyno). NOTE: on Heroku without Postgres,
 # scans are written to an ephemeral SQLite and won't survive a dyno restart.
 # Add DATABASE_URL (Heroku Postgres) to make web-triggered scans persistent.
-_scan_status: dict[str, str] = {}
-_scan_last_completed: dict[str, float] = {}  # domain → unix timestamp
+# Bounded so one entry per submitted domain doesn't accumulate forever; the
+# rate limit also checks the DB, so expiry doesn't depend on this state.
+_scan_status: _ExpiringDict[str] = _ExpiringDict(ttl=RATE_LIMIT_SECONDS, maxsize=10_000)
+# domain → unix timestamp
+_scan_last_completed: _ExpiringDict[float] = _ExpiringDict(
+    ttl=RATE_LIMIT_SECONDS, maxsize=10_000
+)
 
-RATE_LIMIT_SECONDS = 60 * 60 * 6  # 6 hours between web-triggered rescans
+# Web-triggered scans: requests in flight, and results written per transaction
+_WEB_SCAN_CONCURRENCY = 5
+_WEB_STORE_BATCH = 20
+
+# Listing/archive URLs that are never articles, dropped before scanning
+_SKIP_URL_RE = re.compile(r"/(?:tag|page|author|category)/")
+
+# Bumped after this process writes to the DB; cached reads from an older
+# generation are recomputed. Writes from other processes (CLI, worker) show
+# up when the entry's TTL runs out.
+_cache_generation = 0
+
+
+class _TTLCache:
+    """Per-process memo of slow aggregate reads, keyed by a hashable key."""
+
+    def __init__(self, ttl: float, maxsize: int) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: dict[Hashable, tuple[float, int, Any]] = {}
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        now = time.monotonic()
+        hit = self._data.get(key)
+        if hit is not None and hit[0] > now and hit[1] == _cache_generation:
+            return hit[2]
+        value = compute()
+        if len(self._data) >= self.maxsize:
+            self._data.clear()
+        self._data[key] = (now + self.ttl, _cache_generation, value)
+        return value
+
+
+def _invalidate_caches() -> None:
+    global _cache_generation
+    _cache_generation += 1
+
+
+_page_cache = _TTLCache(ttl=60, maxsize=256)
+_badge_cache = _TTLCache(ttl=300, maxsize=10_000)
 
 # Lazy-loaded analyzer singleton (loaded once at first scan request)
-_analyzer = None
-_analyzer_config = None
+_analyzer: Analyzer | None = None
+_analyzer_config: AppConfig | None = None
+_analyzer_lock = threading.Lock()
 
 
-def _get_analyzer():
+def _get_analyzer() -> tuple[Analyzer, AppConfig]:
     global _analyzer, _analyzer_config
-    if _analyzer is None:
-        from aidar.core.analyzer import Analyzer
-        from aidar.models.config import AppConfig
-        from aidar.patterns.loader import load_patterns, load_weight_config
-        from aidar.patterns.registry import PatternRegistry
-
-        pd_env = os.environ.get("AIDAR_PATTERNS_DIR")
-        pd = Path(pd_env) if pd_env else Path(__file__).parent.parent / "patterns"
-        patterns = load_patterns(pd)
-        weights = load_weight_config(pd)
-        registry = PatternRegistry(patterns)
-        _analyzer = Analyzer(registry)
-        _analyzer_config = AppConfig(patterns_dir=str(pd), weights=weights)
-    return _analyzer, _analyzer_config
+    analyzer, config = _analyzer, _analyzer_config
+    if analyzer is None or config is None:
+        with _analyzer_lock:
+            analyzer, config = _analyzer, _analyzer_config
+            if analyzer is None or config is None:
+                analyzer, config = _load_analyzer()
+                # Config first: readers check _analyzer without the lock
+                _analyzer_config = config
+                _analyzer = analyzer
+    return analyzer, config
+
+
+def _load_analyzer() -> tuple[Analyzer, AppConfig]:
+    from aidar.core.analyzer import Analyzer
+    from aidar.models.config import AppConfig
+    from aidar.patterns.loader import load_patterns, load_weight_config
+    from aidar.patterns.registry import PatternRegistry
+
+    pd_env = os.environ.get("AIDAR_PATTERNS_DIR")
+    pd = Path(pd_env) if pd_env else Path(__file__).parent.parent / "patterns"
+    patterns = load_patterns(pd)
+    weights = load_weight_config(pd)
+    registry = PatternRegistry(patterns)
+    return Analyzer(registry), AppConfig(patterns_dir=str(pd), weights=weights)
+
+
+_scan_pool: ProcessPoolExecutor | None = None
+_scan_pool_lock = threading.Lock()
+
+
+def _get_scan_pool() -> ProcessPoolExecutor:
+    """
+    Process pool for web-scan extraction and scoring, shared by every scan;
+    call it off the event loop (the first call starts the workers).
+
+    Workers come from a forkserver rather than fork(): this process runs
+    threads (uvicorn's threadpool, SQLite pools) whose locks a forked child
+    would inherit mid-use. Each worker loads its own analyzer on first use
+    and keeps it for the life of the pool.
+
+    Forkserver workers re-import the parent's __main__ module. A script that
+    imports this app and triggers a scan (tests, one-off tooling) must keep
+    its entry point under `if __name__ == "__main__":`, or every worker
+    re-runs it. Serving through the uvicorn CLI is unaffected.
+    """
+    global _scan_pool
+    if _scan_pool is None:
+        with _scan_pool_lock:
+            if _scan_pool is None:
+                workers = max(1, min(os.cpu_count() or 1, _WEB_SCAN_CONCURRENCY))
+                pool = ProcessPoolExecutor(
+                    max_workers=workers, mp_context=multiprocessing.get_context("forkserver")
+                )
+                # Workers start on submit and starting one blocks the caller:
+                # start them all here, so run_in_executor on the loop never does
+                for future in [pool.submit(int) for _ in range(workers)]:
+                    future.result()
+                _scan_pool = pool
+    return _scan_pool
+
+
+def _scan_page(url: str, html: str) -> AggregateResult | None:
+    """
+    Extract and score one fetched page; None when it has no article text.
+
+    Runs in a _get_scan_pool() worker: trafilatura and the detectors are
+    CPU-bound and would otherwise hold the GIL against request handling.
+    """
+    from aidar.core.fetcher import _extract
+    from aidar.core.scorer import compute_aggregate
+
+    fetch = _extract(html)
+    if fetch is None:
+        return None
+    analyzer, config = _get_analyzer()
+    sv = analyzer.run(fetch.text, fetch.word_count)
+    return compute_aggregate(
+        sv, config,
+        url=url,
+        word_count=fetch.word_count,
+        published_date=fetch.published_date,
+        title=fetch.title,
+    )
 
 
 async def _run_domain_scan(domain: str, limit: int = 200) -> None:
     """Background task: discover → filter → scan → store results for a domain."""
     from urllib.parse import urlparse
 
-    from aidar.core.fetcher import fetch_url_async
-    from aidar.core.scorer import compute_aggregate
-    from aidar.db.queries import store_result, url_already_scanned
+    from aidar.core.fetcher import fetch_html_async, make_async_client
+    from aidar.db.queries import bulk_store_results, bulk_urls_already_scanned
 
     def _normalize(d: str) -> str:
         if not d.startswith(("http://", "https://")):
@@ -98,45 +331,45 @@ async def _run_domain_scan(domain: str, limit: int = 200) -> None:
     _scan_status[domain] = "running"
     try:
         base_url = _normalize(domain)
-        urls = _discover(base_url)
+        # sitemap/feed discovery and SQLite are blocking: keep them off the event loop
+        urls = await run_in_threadpool(_discover, base_url)
         if not urls:
             _scan_status[domain] = "error:no_urls"
             return
 
-        # Filter common non-article URL patterns
-        skip = ("/tag/", "/page/", "/author/", "/category/")
-        urls = [u for u in urls if not any(p in u for p in skip)]
+        urls = [u for u in urls if not _SKIP_URL_RE.search(u)]
 
-        conn = get_conn()
-        urls = [u for u in urls if not url_already_scanned(conn, u)][:limit]
+        scanned = await run_in_threadpool(_read, bulk_urls_already_scanned, urls)
+        urls = [u for u in urls if u not in scanned][:limit]
         if not urls:
             _scan_status[domain] = "done"
             return
 
-        analyzer, config = _get_analyzer()
-        semaphore = asyncio.Semaphore(5)
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(_WEB_SCAN_CONCURRENCY)
+        pool = await run_in_threadpool(_get_scan_pool)
 
-        async def _scan_one(url: str, client: httpx.AsyncClient):
+        async def _scan_one(url: str, client: httpx.AsyncClient) -> AggregateResult | None:
             async with semaphore:
                 try:
-                    fetch = await fetch_url_async(url, client)
-                    sv = analyzer.run(fetch.text, fetch.word_count)
-                    return compute_aggregate(
-                        sv, config,
-                        url=url,
-                        word_count=fetch.word_count,
-                        published_date=fetch.published_date,
-                        title=fetch.title,
-                    )
+                    html = await fetch_html_async(url, client)
+                    return await loop.run_in_executor(pool, _scan_page, url, html)
                 except Exception:
                     return None
 
-        async with httpx.AsyncClient(timeout=30) as client:
-            results = await asyncio.gather(*[_scan_one(u, client) for u in urls])
-
-        for r in results:
-            if r is not None:
-                store_result(conn, r)
+        # Store in batches as pages finish, so results show up while the scan runs
+        batch: list[AggregateResult] = []
+        async with make_async_client(_WEB_SCAN_CONCURRENCY) as client:
+            for pending in asyncio.as_completed([_scan_one(u, client) for u in urls]):
+                result = await pending
+                if result is None:
+                    continue
+                batch.append(result)
+                if len(batch) >= _WEB_STORE_BATCH:
+                    await run_in_threadpool(_write, bulk_store_results, batch)
+                    batch = []
+        if batch:
+            await run_in_threadpool(_write, bulk_store_results, batch)
 
         _scan_status[domain] = "done"
         _scan_last_completed[domain] = time.time()
@@ -144,23 +377,66 @@ async def _run_domain_scan(domain: str, limit: int = 200) -> None:
         _scan_status[domain] = "error"
 
 
-def get_conn():
-    return get_connection(DB_PATH)
+_writer: WriterConn | None = None
+_readers: ReaderPool | None = None
+_pool_lock = threading.Lock()
 
 
-@app.get("/", response_class=HTMLResponse)
-async def index(request: Request, q: str = ""):
-    conn = get_conn()
-    leaderboard = get_domain_leaderboard(conn, limit=100)
-    stats = get_global_stats(conn)
-    # Add percentile to each leaderboard row
-    total = stats.get("total_scans") or 1
+def _get_pools() -> tuple[WriterConn, ReaderPool]:
+    """One writer + a small read-only pool per process, opened on first use."""
+    global _writer, _readers
+    writer, readers = _writer, _readers
+    if writer is None or readers is None:
+        with _pool_lock:
+            writer, readers = _writer, _readers
+            if writer is None or readers is None:
+                # Writer first: it creates/migrates the schema the readers open
+                writer = WriterConn(DB_PATH)
+                readers = ReaderPool(DB_PATH)
+                _readers = readers
+                _writer = writer
+    return writer, readers
+
+
+def read_conn() -> AbstractContextManager[sqlite3.Connection]:
+    """Context manager yielding a pooled read-only connection."""
+    return _get_pools()[1].connection()
+
+
+def write_conn() -> AbstractContextManager[sqlite3.Connection]:
+    """Context manager yielding the shared write connection (one holder at a time)."""
+    return _get_pools()[0].connection()
+
+
+def _read(query: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+    """Run `query(conn, ...)` on a pooled reader; for run_in_threadpool from async code."""
+    with read_conn() as conn:
+        return query(conn, *args, **kwargs)
+
+
+def _write(query: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+    """Run `query(conn, ...)` on the writer, then drop cached reads it made stale."""
+    with write_conn() as conn:
+        result = query(conn, *args, **kwargs)
+    _invalidate_caches()
+    return result
+
+
+def _homepage_data() -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    with read_conn() as conn:
+        leaderboard = get_domain_leaderboard(conn, limit=100)
+        stats = get_global_stats(conn)
+        averages = get_domain_averages(conn)
+    # Add percentile to each leaderboard row: domains averaging at or below it
     for row in leaderboard:
-        below = conn.execute(
-            "SELECT COUNT(*) FROM scans WHERE domain != '' GROUP BY domain HAVING AVG(score) <= ?",
-            (row["avg_score"],),
-        ).fetchall()
-        row["percentile"] = round(len(below) / max(len(leaderboard), 1) * 100)
+        below = bisect_right(averages, row["avg_score"])
+        row["percentile"] = round(below / max(len(leaderboard), 1) * 100)
+    return leaderboard, stats
+
+
+@app.get("/", response_class=HTMLResponse)
+def index(request: Request, q: str = "") -> HTMLResponse:
+    leaderboard, stats = _page_cache.get_or_compute("index", _homepage_data)
     return templates.TemplateResponse(
         "index.html",
         {"request": request, "leaderboard": leaderboard, "stats": stats, "q": q},
@@ -168,17 +444,23 @@ async def index(request: Request, q: str = ""):
 
 
 @app.post("/submit", response_class=HTMLResponse)
-async def submit_site(request: Request, background_tasks: BackgroundTasks):
+async def submit_site(request: Request, background_tasks: BackgroundTasks) -> Response:
     from fastapi.responses import RedirectResponse
 
     form = await request.form()
-    domain = str(form.get("domain", "")).strip().lstrip("https://").lstrip("http://").rstrip("/")
+    # removeprefix, not lstrip: lstrip("https://") strips a character set and
+    # would turn "stackoverflow.com" into "ackoverflow.com"
+    domain = (
+        str(form.get("domain", "")).strip()
+        .removeprefix("https://").removeprefix("http://").rstrip("/")
+    )
     if not domain:
-        conn = get_conn()
+        leaderboard = await run_in_threadpool(_read, get_domain_leaderboard, limit=100)
+        stats = await run_in_threadpool(_read, get_global_stats)
         return templates.TemplateResponse(
             "index.html",
-            {"request": request, "leaderboard": get_domain_leaderboard(conn, limit=100),
-             "stats": get_global_stats(conn), "submit_error": "Enter a domain."},
+            {"request": request, "leaderboard": leaderboard,
+             "stats": stats, "submit_error": "Enter a domain."},
         )
 
     # Rate limit: already in flight?
@@ -191,8 +473,7 @@ async def submit_site(request: Request, background_tasks: BackgroundTasks):
         return RedirectResponse(url=f"/domain/{domain}", status_code=303)
 
     # Rate limit: check DB for recent scan (survives dyno restarts)
-    conn = get_conn()
-    stats = get_domain_stats(conn, domain)
+    stats = await run_in_threadpool(_read, get_domain_stats, domain)
     if stats.get("latest"):
         try:
             from datetime import datetime, timezone
@@ -203,36 +484,51 @@ async def submit_site(request: Request, background_tasks: BackgroundTasks):
         except Exception:
             pass
 
+    # Re-check after the awaits above: a concurrent submit for the same domain
+    # may have queued it meanwhile. No await between this check and the set,
+    # so on the single event loop only one request can win.
+    if _scan_status.get(domain) in ("queued", "running"):
+        return RedirectResponse(url=f"/domain/{domain}", status_code=303)
     _scan_status[domain] = "queued"
     background_tasks.add_task(_run_domain_scan, domain)
     return RedirectResponse(url=f"/domain/{domain}", status_code=303)
 
 
+# Pages averaged in domain.html's "signal breakdown" section
+_BREAKDOWN_SCANS = 20
+
+
 @app.get("/domain/{domain:path}", response_class=HTMLResponse)
-async def domain_page(request: Request, domain: str, sort: str = "recent"):
-    conn = get_conn()
-    stats = get_domain_stats(conn, domain)
+def domain_page(request: Request, domain: str, sort: str = "recent") -> Response:
     scan_status = _scan_status.get(domain)
-    if stats.get("scans", 0) == 0:
-        status_code = 200 if scan_status in ("queued", "running") else 404
-        return templates.TemplateResponse(
-            "domain_missing.html",
-            {"request": request, "domain": domain, "scan_status": scan_status},
-            status_code=status_code,
-        )
     sort = sort if sort in ("recent", "highest", "lowest") else "recent"
-    scans = get_domain_scans(conn, domain, limit=200, sort=sort)
-    trend = get_domain_trend(conn, domain)
-    percentile = get_corpus_percentile(conn, int(stats.get("avg_score", 0)))
-    top_pages, bottom_pages = get_domain_extremes(conn, domain, n=5)
-
-    for scan in scans:
+    with read_conn() as conn:
+        stats = get_domain_stats(conn, domain)
+        if stats.get("scans", 0) == 0:
+            status_code = 200 if scan_status in ("queued", "running") else 404
+            return templates.TemplateResponse(
+                "domain_missing.html",
+                {"request": request, "domain": domain, "scan_status": scan_status},
+                status_code=status_code,
+            )
+        percentile = get_corpus_percentile(conn, int(stats.get("avg_score", 0)))
+        # Answer revalidation with 304 before the heavier queries and the render
+        etag = _domain_etag(domain, sort, stats, percentile)
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        scans = get_domain_scans(conn, domain, limit=200, sort=sort)
+        trend = get_domain_trend(conn, domain)
+        top_pages, bottom_pages = get_domain_extremes(conn, domain, n=5)
+
+    # domain.html only reads categories for the signal breakdown over the
+    # first _BREAKDOWN_SCANS rows; decoding the rest is wasted work
+    for scan in scans[:_BREAKDOWN_SCANS]:
         try:
-            scan["categories"] = json.loads(scan.get("score_json") or "{}")
+            scan["categories"] = _loads(scan.get("score_json") or "{}")
         except Exception:
             scan["categories"] = {}
 
-    return templates.TemplateResponse(
+    response = templates.TemplateResponse(
         "domain.html",
         {
             "request": request,
@@ -244,13 +540,44 @@ async def domain_page(request: Request, domain: str, sort: str = "recent"):
             "top_pages": top_pages,
             "bottom_pages": bottom_pages,
             "sort": sort,
+            "breakdown_scans": _BREAKDOWN_SCANS,
             "admin_key_set": bool(ADMIN_KEY),
         },
     )
+    response.headers["ETag"] = etag
+    return response
+
+
+def _templates_digest() -> str:
+    """Tool version plus template contents, so a deploy changes every ETag."""
+    h = hashlib.blake2b(__version__.encode(), digest_size=8)
+    for path in sorted((BASE_DIR / "templates").glob("*.html")):
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+_TEMPLATES_DIGEST = _templates_digest()
+
+
+def _domain_etag(domain: str, sort: str, stats: dict[str, Any], percentile: float) -> str:
+    """Everything domain.html renders from: this domain's stats, its corpus
+    percentile (moves as other domains are scanned), admin controls, templates."""
+    key = (
+        f"{_TEMPLATES_DIGEST}:{domain}:{sort}:{stats['scans']}:{stats['avg_score']}:"
+        f"{stats['latest']}:{percentile}:{bool(ADMIN_KEY)}"
+    )
+    return f'"{hashlib.blake2b(key.encode(), digest_size=8).hexdigest()}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    return any(t.strip().removeprefix("W/") in (etag, "*") for t in header.split(","))
 
 
 @app.post("/admin/delete-domain", response_class=HTMLResponse)
-async def admin_delete_domain(request: Request):
+async def admin_delete_domain(request: Request) -> Response:
     from fastapi.responses import RedirectResponse
 
     if not ADMIN_KEY:
@@ -262,19 +589,21 @@ async def admin_delete_domain(request: Request):
         raise HTTPException(status_code=403, detail="Invalid admin key.")
     if not domain:
         raise HTTPException(status_code=400, detail="No domain specified.")
-    deleted = delete_domain(get_conn(), domain)
+    deleted = await run_in_threadpool(_write, delete_domain, domain)
     return RedirectResponse(url=f"/?deleted={domain}&rows={deleted}", status_code=303)
 
 
 @app.get("/patterns", response_class=HTMLResponse)
-async def patterns_page(request: Request):
-    conn = get_conn()
-    pattern_stats = get_pattern_stats(conn)
-    global_stats = get_global_stats(conn)
+def patterns_page(request: Request) -> HTMLResponse:
+    def _load() -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        with read_conn() as conn:
+            return get_pattern_stats(conn), get_global_stats(conn)
+
+    pattern_stats, global_stats = _page_cache.get_or_compute("patterns", _load)
 
     # Build a lookup from pattern_id → PatternDef for the template
     analyzer, _ = _get_analyzer()
-    catalog: dict[str, dict] = {}
+    catalog: dict[str, dict[str, Any]] = {}
     for pat in analyzer.registry.all_patterns():
         catalog[pat.id] = {
             "name": pat.name,
@@ -291,37 +620,76 @@ async def patterns_page(request: Request):
     )
 
 
+@lru_cache(maxsize=1)
+def _about_html() -> bytes:
+    """about.html has no per-request data; base.html only reads request.url.path."""
+    request = SimpleNamespace(url=SimpleNamespace(path="/about"))
+    return templates.get_template("about.html").render(request=request).encode()
+
+
 @app.get("/about", response_class=HTMLResponse)
-async def about(request: Request):
-    return templates.TemplateResponse("about.html", {"request": request})
+async def about(request: Request) -> HTMLResponse:
+    if templates.env.auto_reload:
+        # dev: pick up template edits
+        return templates.TemplateResponse("about.html", {"request": request})
+    return HTMLResponse(_about_html(), headers={"Cache-Control": "public, max-age=3600"})
 
 
 @app.get("/api/leaderboard")
-async def api_leaderboard(limit: int = 100):
-    conn = get_conn()
-    return get_domain_leaderboard(conn, limit=limit)
+def api_leaderboard(limit: int = 100) -> Response:
+    def _load() -> list[dict[str, Any]]:
+        with read_conn() as conn:
+            return get_domain_leaderboard(conn, limit=limit)
+
+    return _json_response(_page_cache.get_or_compute(("leaderboard", limit), _load))
 
 
 @app.get("/api/domain/{domain:path}")
-async def api_domain(domain: str):
-    conn = get_conn()
-    stats = get_domain_stats(conn, domain)
-    if stats.get("scans", 0) == 0:
-        raise HTTPException(status_code=404)
-    scans = get_domain_scans(conn, domain)
-    return {"stats": stats, "scans": scans}
+def api_domain(domain: str) -> Response:
+    with read_conn() as conn:
+        stats = get_domain_stats(conn, domain)
+        if stats.get("scans", 0) == 0:
+            raise HTTPException(status_code=404)
+        scans = get_domain_scans(conn, domain)
+    return _json_response({"stats": stats, "scans": scans})
 
 
 @app.get("/api/scan-status/{domain:path}")
-async def api_scan_status(domain: str):
-    return {"domain": domain, "status": _scan_status.get(domain, "unknown")}
+async def api_scan_status(domain: str) -> Response:
+    return _json_response({"domain": domain, "status": _scan_status.get(domain, "unknown")})
+
+
+_BADGE_SVG = """<svg xmlns="http://www.w3.org/2000/svg" width="{total}" height="20">
+  <linearGradient id="s" x2="0" y2="100%">
+    <stop offset="0" stop-color="#bbb" stop-opacity=".1"/>
+    <stop offset="1" stop-opacity=".1"/>
+  </linearGradient>
+  <clipPath id="r"><rect width="{total}" height="20" rx="3" fill="#fff"/></clipPath>
+  <g clip-path="url(#r)">
+    <rect width="{lw}" height="20" fill="#555"/>
+    <rect x="{lw}" width="{rw}" height="20" fill="{color}"/>
+    <rect width="{total}" height="20" fill="url(#s)"/>
+  </g>
+  <g fill="#fff" text-anchor="middle" font-family="DejaVu Sans,Verdana,Geneva,sans-serif" font-size="11">
+    <text x="{lx}" y="15" fill="#010101" fill-opacity=".3">{left}</text>
+    <text x="{lx}" y="14">{left}</text>
+    <text x="{rx}" y="15" fill="#010101" fill-opacity=".3">{right_text}</text>
+    <text x="{rx}" y="14">{right_text}</text>
+  </g>
+</svg>"""
 
 
 @app.get("/badge/{domain:path}")
-async def badge(domain: str):
+def badge(domain: str) -> Response:
     """SVG badge for embedding: ![aidar](https://aidar.lol/badge/example.com)"""
-    conn = get_conn()
-    stats = get_domain_stats(conn, domain)
+    svg = _badge_cache.get_or_compute(domain, lambda: _render_badge(domain))
+    return Response(content=svg, media_type="image/svg+xml",
+                    headers={"Cache-Control": "public, max-age=3600, s-maxage=86400"})
+
+
+def _render_badge(domain: str) -> str:
+    with read_conn() as conn:
+        stats = get_domain_stats(conn, domain)
 
     if stats.get("scans", 0) == 0:
         right_text = "no data"
@@ -336,6 +704,13 @@ async def badge(domain: str):
         else:
             color = "#4c9"
 
+    return _badge_svg(right_text, color)
+
+
+@lru_cache(maxsize=2048)
+def _badge_svg(right_text: str, color: str) -> str:
+    """Badge markup depends only on the right-hand text and colour, so
+    domains sharing an average share one rendered SVG."""
     left = "aidar"
     lw = len(left) * 7 + 10   # approx pixel width of left label
     rw = len(right_text) * 7 + 10
@@ -343,32 +718,51 @@ async def badge(domain: str):
     lx = lw // 2
     rx = lw + rw // 2
 
-    svg = f"""<svg xmlns="http://www.w3.org/2000/svg" width="{total}" height="20">
-  <linearGradient id="s" x2="0" y2="100%">
-    <stop offset="0" stop-color="#bbb" stop-opacity=".1"/>
-    <stop offset="1" stop-opacity=".1"/>
-  </linearGradient>
-  <clipPath id="r"><rect width="{total}" height="20" rx="3" fill="#fff"/></clipPath>
-  <g clip-path="url(#r)">
-    <rect width="{lw}" height="20" fill="#555"/>
-    <rect x="{lw}" width="{rw}" height="20" fill="{color}"/>
-    <rect width="{total}" height="20" fill="url(#s)"/>
-  </g>
-  <g fill="#fff" text-anchor="middle" font-family="DejaVu Sans,Verdana,Geneva,sans-serif" font-size="11">
-    <text x="{lx}" y="15" fill="#010101" fill-opacity=".3">{left}</text>
-    <text x="{lx}" y="14">{left}</text>
-    <text x="{rx}" y="15" fill="#010101" fill-opacity=".3">{right_text}</text>
-    <text x="{rx}" y="14">{right_text}</text>
-  </g>
-</svg>"""
-    return Response(content=svg, media_type="image/svg+xml",
-                    headers={"Cache-Control": "max-age=3600"})
+    return _BADGE_SVG.format(
+        total=total, lw=lw, rw=rw, lx=lx, rx=rx,
+        color=color, left=left, right_text=right_text,
+    )
+
+
+@lru_cache(maxsize=1)
+def _og_fonts() -> tuple[ImageFont.FreeTypeFont | ImageFont.ImageFont, ...]:
+    """(big, medium, small) fonts for the OG image, loaded from disk once."""
+    from PIL import ImageFont
+
+    # Try to load a decent font; fall back to default
+    try:
+        return (
+            ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSansMono-Bold.ttf", 96),
+            ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf", 36),
+            ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf", 24),
+        )
+    except Exception:
+        return (
+            ImageFont.load_default(size=96),
+            ImageFont.load_default(size=36),
+            ImageFont.load_default(size=24),
+        )
+
+
+_og_cache = _TTLCache(ttl=3600, maxsize=2000)
 
 
 @app.get("/og/{domain:path}")
-async def og_image(domain: str):
+def og_image(domain: str) -> Response:
     """1200×630 Open Graph preview image for a domain."""
-    from PIL import Image, ImageDraw, ImageFont
+    with read_conn() as conn:
+        stats = get_domain_stats(conn, domain)
+    scans = stats.get("scans", 0)
+    avg = stats.get("avg_score", 0) if scans else None
+
+    # Keyed on what the image shows, so a changed score renders afresh
+    png = _og_cache.get_or_compute((domain, avg, scans), lambda: _render_og(domain, avg, scans))
+    return Response(content=png, media_type="image/png",
+                    headers={"Cache-Control": "public, max-age=3600"})
+
+
+def _render_og(domain: str, avg: float | None, scans: int) -> bytes:
+    from PIL import Image, ImageDraw
 
     W, H = 1200, 630
     BG = (10, 10, 10)
@@ -378,22 +772,9 @@ async def og_image(domain: str):
     YELLOW = (250, 204, 21)
     RED = (248, 113, 113)
 
-    conn = get_conn()
-    stats = get_domain_stats(conn, domain)
-    avg = stats.get("avg_score", 0) if stats.get("scans", 0) else None
-
     img = Image.new("RGB", (W, H), BG)
     draw = ImageDraw.Draw(img)
-
-    # Try to load a decent font; fall back to default
-    try:
-        font_big = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSansMono-Bold.ttf", 96)
-        font_med = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf", 36)
-        font_sm = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf", 24)
-    except Exception:
-        font_big = ImageFont.load_default(size=96)
-        font_med = ImageFont.load_default(size=36)
-        font_sm = ImageFont.load_default(size=24)
+    font_big, font_med, font_sm = _og_fonts()
 
     # Top-left brand
     draw.text((60, 50), "aidar.lol", font=font_sm, fill=GREEN)
@@ -418,7 +799,6 @@ async def og_image(domain: str):
         lw2 = bbox3[2] - bbox3[0]
         draw.text(((W - lw2) // 2, 390), label, font=font_sm, fill=color)
 
-        scans = stats.get("scans", 0)
         sub_text = f"avg ai index across {scans} pages"
         bbox4 = draw.textbbox((0, 0), sub_text, font=font_sm)
         sw2 = bbox4[2] - bbox4[0]
@@ -437,6 +817,4 @@ async def og_image(domain: str):
 
     buf = io.BytesIO()
     img.save(buf, format="PNG", optimize=True)
-    buf.seek(0)
-    return StreamingResponse(buf, media_type="image/png",
-                             headers={"Cache-Control": "max-age=3600"})
+    return buf.getvalue()